@@ -1,20 +1,38 @@
 """The Brisbane Bin Day integration."""
 from __future__ import annotations
 
+import asyncio
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN
+from .const import DOMAIN, DATA_STARTUP_REFRESHES, STARTUP_REFRESH_CONCURRENCY
 from .coordinator import BccApiDataUpdateCoordinator
+from .services import async_setup_services
+from .store import create_store
+
+PLATFORMS = [Platform.CALENDAR, Platform.SENSOR]
 
-PLATFORMS = [Platform.SENSOR]
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the services of the integration."""
+    async_setup_services(hass)
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up bin day from a config entry."""
     coordinator = BccApiDataUpdateCoordinator(hass, entry)
-    await coordinator.async_config_entry_first_refresh()
+
+    # Serve the last good data, if any, straight away, and otherwise start
+    # the entities as unknown.  Either way the refresh happens in the
+    # background, so a slow or unavailable council API doesn't hold up setup.
+    await coordinator.async_restore()
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
 
@@ -22,9 +40,33 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     entry.async_on_unload(entry.add_update_listener(async_update_options))
 
+    entry.async_create_background_task(
+        hass, _async_startup_refresh(hass, coordinator), f"{DOMAIN} refresh {entry.entry_id}")
+
     return True
 
 
+@callback
+def _get_startup_refreshes(hass: HomeAssistant) -> asyncio.Semaphore:
+    """Return the limit on the concurrent startup refreshes of every config entry."""
+    if DATA_STARTUP_REFRESHES not in hass.data:
+        hass.data[DATA_STARTUP_REFRESHES] = asyncio.Semaphore(STARTUP_REFRESH_CONCURRENCY)
+    return hass.data[DATA_STARTUP_REFRESHES]
+
+
+async def _async_startup_refresh(
+        hass: HomeAssistant,
+        coordinator: BccApiDataUpdateCoordinator
+) -> None:
+    """Refresh an entry that's just been set up, alongside (a limited number of) the others.
+
+    Entries refreshing together have their days records fetched in the
+    same batches.
+    """
+    async with _get_startup_refreshes(hass):
+        await coordinator.async_refresh()
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
@@ -34,6 +76,13 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the data saved for a config entry."""
+    await create_store(hass, entry.entry_id).async_remove()
+
+
 async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Update options."""
-    await hass.config_entries.async_reload(entry.entry_id)
+    """Update options, reloading only if they affect what's fetched."""
+    coordinator: BccApiDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    if not coordinator.async_apply_options():
+        await hass.config_entries.async_reload(entry.entry_id)
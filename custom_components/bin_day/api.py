@@ -0,0 +1,238 @@
+"""Async client for the BCC (Opendatasoft) API."""
+
+from __future__ import annotations
+
+import logging
+
+from collections.abc import AsyncIterator
+from time import perf_counter, time
+from typing import Any
+from urllib.parse import parse_qsl, quote_plus, urlencode, urlsplit, urlunsplit
+
+import aiohttp
+import orjson
+
+from .const import API_CONNECT_TIMEOUT_SECONDS, API_READ_TIMEOUT_SECONDS, API_PAGE_SIZE
+from .metrics import (
+    CacheOutcome,
+    FailureCategory,
+    FetchSample,
+    RefreshMetrics,
+    SharedFetchMetrics,
+)
+from .ratelimit import TokenBucket
+from .response_cache import CachedResponse, ResponseCache, expires_at
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class BccApiError(Exception):
+    """Raised when the BCC API can't be reached or returns an error."""
+
+
+class BccApiClient:
+    """Fetches records from the BCC API over a shared, pooled aiohttp session."""
+
+    _session: aiohttp.ClientSession
+    _base_url: str
+    _timeout: aiohttp.ClientTimeout
+    _response_cache: ResponseCache | None
+    _metrics: RefreshMetrics | SharedFetchMetrics | None
+    _rate_limiter: TokenBucket | None
+
+    def __init__(
+            self,
+            session: aiohttp.ClientSession,
+            base_url: str,
+            response_cache: ResponseCache | None = None,
+            metrics: RefreshMetrics | SharedFetchMetrics | None = None,
+            rate_limiter: TokenBucket | None = None
+    ) -> None:
+        """Initialize the client; the session is owned (and pooled) by the caller."""
+        self._session = session
+        self._base_url = base_url
+        self._response_cache = response_cache
+        self._metrics = metrics
+        self._rate_limiter = rate_limiter
+        self._timeout = aiohttp.ClientTimeout(
+            total=None,
+            connect=API_CONNECT_TIMEOUT_SECONDS,
+            sock_read=API_READ_TIMEOUT_SECONDS,
+        )
+
+    @property
+    def base_url(self) -> str:
+        """Return the URL template this client formats its requests from."""
+        return self._base_url
+
+    @property
+    def metrics(self) -> RefreshMetrics | SharedFetchMetrics | None:
+        """Return where this client records its requests, if anywhere."""
+        return self._metrics
+
+    def with_metrics(self, metrics: RefreshMetrics | SharedFetchMetrics | None) -> BccApiClient:
+        """Return a client for the same API that records its requests elsewhere."""
+        return BccApiClient(
+            self._session, self._base_url, self._response_cache, metrics, self._rate_limiter)
+
+    def records_url(
+            self,
+            dataset: str,
+            query: str,
+            limit: int | None = None,
+            offset: int | None = None
+    ) -> str:
+        """Build the full records URL for the given dataset, query and page."""
+        full_url = self._base_url.format(**{
+            'dataset': dataset,
+            'query': quote_plus(query)
+        })
+        if limit is None and offset is None:
+            return full_url
+
+        # Override whatever paging the configured URL has, e.g. 'limit=1'.
+        parts = urlsplit(full_url)
+        params = [
+            (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if key not in ('limit', 'offset')
+        ]
+        if limit is not None:
+            params.append(('limit', str(limit)))
+        if offset is not None:
+            params.append(('offset', str(offset)))
+        return urlunsplit(parts._replace(query=urlencode(params)))
+
+    async def async_get_all_records(
+            self,
+            dataset: str,
+            query: str,
+            page_size: int = API_PAGE_SIZE,
+            max_records: int | None = None
+    ) -> list[dict[str, Any]]:
+        """Fetch every record matching the query, paging through them with offset.
+
+        If the caller knows there can be at most 'max_records' (e.g. one per
+        property asked for), it stops once it has them, rather than asking
+        for an empty page to find out there are no more.
+        """
+        results: list[dict[str, Any]] = []
+        while True:
+            page = await self.async_get_records(dataset, query, page_size, len(results))
+            results.extend(page)
+            if len(page) < page_size or (
+                    max_records is not None and len(results) >= max_records):
+                return results
+
+    async def async_get_records(
+            self,
+            dataset: str,
+            query: str,
+            limit: int | None = None,
+            offset: int | None = None
+    ) -> list[dict[str, Any]]:
+        """Fetch the records matching the query from the dataset.
+
+        The request is a plain coroutine so cancelling the calling task
+        cancels the request and returns the connection to the pool.
+        """
+        full_url = self.records_url(dataset, query, limit, offset)
+        sample = FetchSample(dataset=dataset, started_at=time())
+        started = perf_counter()
+
+        try:
+            json = await self._async_get_json(full_url, sample)
+            if 'error_code' in json:
+                sample.failure = FailureCategory.API
+                raise BccApiError(f"{dataset}: {json['error_code']}: {json['message']}")
+            if sample.failure is not None:
+                raise BccApiError(f"{dataset}: HTTP error response")
+        except TimeoutError as err:
+            sample.failure = FailureCategory.TIMEOUT
+            raise BccApiError(f"Timeout requesting {dataset}: {err!r}") from err
+        except aiohttp.ClientError as err:
+            sample.failure = FailureCategory.CONNECTION
+            raise BccApiError(f"Error requesting {dataset}: {err!r}") from err
+        except ValueError as err:
+            sample.failure = sample.failure or FailureCategory.PARSE
+            raise BccApiError(f"Error parsing {dataset}: {err!r}") from err
+        finally:
+            sample.total_seconds = perf_counter() - started
+            if self._metrics is not None:
+                self._metrics.record_fetch(sample)
+
+        return json['results']
+
+    async def _async_get_json(self, full_url: str, sample: FetchSample) -> Any:
+        """Get the decoded JSON at the URL, from the response cache where possible."""
+        cache = self._response_cache
+        cached = None if cache is None else await cache.async_get(full_url)
+        if cached is not None and cached.is_fresh():
+            cache.stats.hits += 1
+            sample.cache = CacheOutcome.HIT
+            return cached.body
+
+        headers = {} if cached is None else cached.validators()
+        if self._rate_limiter is not None:
+            await self._rate_limiter.async_acquire()
+        _LOGGER.debug("Requesting %s", full_url)
+
+        started = perf_counter()
+        async with self._session.get(
+                full_url, headers=headers, timeout=self._timeout) as response:
+            sample.response_seconds = perf_counter() - started
+            cache_expires_at = expires_at(response.headers.get('Cache-Control'))
+
+            if response.status == 304 and cached is not None:
+                cache.stats.revalidations += 1
+                sample.cache = CacheOutcome.REVALIDATED
+                if cache_expires_at is not None:
+                    cached.expires_at = cache_expires_at
+                    cache.async_put(full_url, cached)
+                return cached.body
+
+            body = await response.read()
+            sample.payload_bytes = len(body)
+            if response.status >= 400:
+                # The API reports most errors in the body, but not all.
+                sample.failure = FailureCategory.HTTP
+            started = perf_counter()
+            json = orjson.loads(body)
+            sample.parse_seconds = perf_counter() - started
+            if cache is None:
+                return json
+
+            cache.stats.misses += 1
+            sample.cache = CacheOutcome.MISS
+            if (cache_expires_at is not None and response.status == 200 and
+                    'error_code' not in json):
+                cache.async_put(full_url, CachedResponse(
+                    body=json,
+                    etag=response.headers.get('ETag'),
+                    last_modified=response.headers.get('Last-Modified'),
+                    expires_at=cache_expires_at,
+                ))
+            return json
+
+    async def async_stream_export(
+            self,
+            export_url: str,
+            dataset: str
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream every record of the dataset from its JSON lines export.
+
+        Records are yielded as each line arrives, so the export is never
+        held in memory as a whole.
+        """
+        full_url = export_url.format(**{'dataset': dataset})
+        if self._rate_limiter is not None:
+            await self._rate_limiter.async_acquire()
+        _LOGGER.debug("Streaming %s", full_url)
+
+        try:
+            async with self._session.get(full_url, timeout=self._timeout) as response:
+                response.raise_for_status()
+                async for line in response.content:
+                    if line.strip():
+                        yield orjson.loads(line)
+        except (aiohttp.ClientError, TimeoutError, orjson.JSONDecodeError) as err:
+            raise BccApiError(f"Error exporting {dataset}: {err!r}") from err
@@ -0,0 +1,165 @@
+"""Batched fetching of the collection days records of many properties."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from collections import defaultdict
+from time import monotonic
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .api import BccApiClient
+from .const import DATA_BATCH_FETCHER, BATCH_CHUNK_SIZE, BATCH_CACHE_SECONDS
+from .data import DaysRecord
+from .metrics import RefreshMetrics, SharedFetchMetrics
+
+_LOGGER = logging.getLogger(__name__)
+
+# A days dataset is identified by the URL template it's fetched with and its name.
+DatasetKey = tuple[str, str]
+
+
+@callback
+def get_batch_fetcher(hass: HomeAssistant) -> BccApiBatchFetcher:
+    """Return the batch fetcher shared by every config entry."""
+    if DATA_BATCH_FETCHER not in hass.data:
+        hass.data[DATA_BATCH_FETCHER] = BccApiBatchFetcher()
+    return hass.data[DATA_BATCH_FETCHER]
+
+
+class BccApiBatchFetcher:
+    """Fetches the days records of all loaded properties in as few requests as possible.
+
+    Whenever any entry needs its record, the records of every registered
+    property of the same dataset are fetched in chunks and cached, so the
+    other entries' refreshes are served without further round trips.
+    """
+
+    _properties: defaultdict[DatasetKey, set[int]]
+    _metrics: defaultdict[DatasetKey, list[RefreshMetrics]]
+    _records: dict[tuple[DatasetKey, int], tuple[float, DaysRecord | None]]
+    _in_flight: dict[DatasetKey, asyncio.Future[None]]
+
+    def __init__(self) -> None:
+        """Initialize the batch fetcher."""
+        self._properties = defaultdict(set)
+        self._metrics = defaultdict(list)
+        self._records = {}
+        self._in_flight = {}
+
+    @callback
+    def async_register(
+            self,
+            client: BccApiClient,
+            days_table: str,
+            property_number: int
+    ) -> CALLBACK_TYPE:
+        """Include the property in every batch; returns a callback to remove it.
+
+        The client's metrics record every batch's requests, as they're made
+        on behalf of all the registered properties.
+        """
+        key = (client.base_url, days_table)
+        self._properties[key].add(property_number)
+        metrics = client.metrics
+        if isinstance(metrics, RefreshMetrics):
+            self._metrics[key].append(metrics)
+
+        @callback
+        def _unregister() -> None:
+            self._properties[key].discard(property_number)
+            self._records.pop((key, property_number), None)
+            if metrics in self._metrics[key]:
+                self._metrics[key].remove(metrics)
+
+        return _unregister
+
+    async def async_get_days_record(
+            self,
+            client: BccApiClient,
+            days_table: str,
+            property_number: int
+    ) -> DaysRecord | None:
+        """Return the property's record, or None if the dataset has no such property."""
+        key = (client.base_url, days_table)
+
+        for _ in range(2):
+            cached = self._records.get((key, property_number))
+            if cached is not None and cached[0] > monotonic():
+                return cached[1]
+
+            # Join the batch already under way for this dataset, if any.  It
+            # won't include a property that registered after it started, in
+            # which case the second pass fetches a fresh batch.
+            if (in_flight := self._in_flight.get(key)) is None:
+                in_flight = asyncio.ensure_future(
+                    self._async_fetch_batch(
+                        client, days_table, self._properties[key] | {property_number}))
+                self._in_flight[key] = in_flight
+                in_flight.add_done_callback(lambda _: self._in_flight.pop(key, None))
+            await asyncio.shield(in_flight)
+
+        return self._records.get((key, property_number), (0.0, None))[1]
+
+    async def async_get_days_records(
+            self,
+            client: BccApiClient,
+            days_table: str,
+            property_numbers: list[int]
+    ) -> dict[int, DaysRecord | None]:
+        """Return the records of any properties, registered or not, fetching the uncached."""
+        key = (client.base_url, days_table)
+        now = monotonic()
+        uncached = {
+            number for number in property_numbers
+            if (cached := self._records.get((key, number))) is None or cached[0] <= now
+        }
+        if uncached:
+            await self._async_fetch_batch(client, days_table, uncached)
+        return {
+            number: self._records.get((key, number), (0.0, None))[1]
+            for number in property_numbers
+        }
+
+    async def _async_fetch_batch(
+            self,
+            client: BccApiClient,
+            days_table: str,
+            property_numbers: set[int]
+    ) -> None:
+        """Fetch and cache the records of the properties, in as few requests as possible."""
+        key = (client.base_url, days_table)
+        property_numbers = sorted(property_numbers)
+        now = monotonic()
+        expires = now + BATCH_CACHE_SECONDS
+
+        # Drop what's expired, e.g. the records of one-off lookups.
+        self._records = {
+            record_key: cached for record_key, cached in self._records.items()
+            if cached[0] > now
+        }
+
+        # Whichever client starts the batch, its requests are for every entry.
+        shared_metrics = list(self._metrics[key])
+        if isinstance(client.metrics, RefreshMetrics) and client.metrics not in shared_metrics:
+            shared_metrics.append(client.metrics)
+        client = client.with_metrics(SharedFetchMetrics(shared_metrics))
+
+        _LOGGER.debug(
+            "Fetching collection day data for %d properties from %s",
+            len(property_numbers), days_table)
+
+        for start in range(0, len(property_numbers), BATCH_CHUNK_SIZE):
+            chunk = property_numbers[start:start + BATCH_CHUNK_SIZE]
+            query = f"property_id in ({', '.join(str(number) for number in chunk)})"
+            # A property has one record, so a full chunk is one full page.
+            results = await client.async_get_all_records(
+                days_table, query, len(chunk), max_records=len(chunk))
+
+            found = {int(result['property_id']): result for result in results}
+            for number in chunk:
+                result = found.get(number)
+                self._records[(key, number)] = (
+                    expires, None if result is None else DaysRecord.from_result(result))
@@ -0,0 +1,115 @@
+"""Sets up the collection calendar for the Brisbane Bin Day service."""
+
+from __future__ import annotations
+
+import logging
+
+from datetime import date, datetime, timedelta
+
+from homeassistant.components.calendar import (
+    DOMAIN as CALENDAR_DOMAIN,
+)
+from homeassistant.components.calendar import (
+    CalendarEntity,
+    CalendarEvent,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, CALENDAR_HORIZON_DAYS
+from .coordinator import BccApiDataUpdateCoordinator
+from .schedule import Collection, CollectionIndex, CollectionType
+
+_LOGGER = logging.getLogger(__name__)
+
+SUMMARIES = {
+    CollectionType.GENERAL: 'Red/General Waste',
+    CollectionType.RECYCLING: 'Yellow/Recycling',
+    CollectionType.GREEN_WASTE: 'Green/Garden Waste',
+}
+
+
+async def async_setup_entry(
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        async_add_entities: AddEntitiesCallback
+) -> None:
+    """Set up the collection calendar."""
+    coordinator: BccApiDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    async_add_entities([
+        BinDayCalendarEntity(
+            entry_id=entry.entry_id,
+            coordinator=coordinator,
+        )
+    ])
+
+
+def _event(collection: Collection) -> CalendarEvent:
+    """Return the all-day calendar event of a collection."""
+    return CalendarEvent(
+        start=collection.day,
+        end=collection.day + timedelta(days=1),
+        summary=SUMMARIES[collection.type],
+        description=collection.type,
+    )
+
+
+class BinDayCalendarEntity(CoordinatorEntity[BccApiDataUpdateCoordinator], CalendarEntity):
+    """Defines a calendar of upcoming bin collections."""
+
+    _attr_has_entity_name = True
+    _attr_translation_key = "collections"
+    _index: CollectionIndex
+
+    def __init__(
+        self,
+        *,
+        entry_id: str,
+        coordinator: BccApiDataUpdateCoordinator,
+    ) -> None:
+        """Initialize the bin day calendar."""
+        super().__init__(coordinator=coordinator)
+        self.entity_id = f"{CALENDAR_DOMAIN}.{DOMAIN}_collections"
+        self._attr_unique_id = f"{entry_id}_collections"
+
+        self._attr_device_info = coordinator.device_info
+
+        self._build_index()
+
+    def _build_index(self) -> None:
+        """Precompute the collections from the coordinator's data."""
+        data = self.coordinator.data
+        self._index = (
+            CollectionIndex([]) if data is None else
+            CollectionIndex.build(
+                data, self.coordinator.zone_schedule,
+                date.today(), CALENDAR_HORIZON_DAYS))
+        _LOGGER.debug("Indexed %d collections", len(self._index.collections))
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Rebuild the index from the updated data."""
+        self._build_index()
+        super()._handle_coordinator_update()
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        """Return the next upcoming collection."""
+        collection = self._index.next(date.today())
+        return None if collection is None else _event(collection)
+
+    async def async_get_events(
+            self,
+            hass: HomeAssistant,
+            start_date: datetime,
+            end_date: datetime
+    ) -> list[CalendarEvent]:
+        """Return the collections between the given times."""
+        # An all-day event overlaps the range if its day does.
+        first_day = dt_util.as_local(start_date).date()
+        last_day = (dt_util.as_local(end_date) - timedelta(microseconds=1)).date()
+        return [_event(collection) for collection in self._index.between(first_day, last_day)]
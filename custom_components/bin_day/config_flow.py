@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
+
 from typing import Any
 import voluptuous as vol
 
@@ -13,6 +16,12 @@ from homeassistant.config_entries import (
 )
 from homeassistant.core import callback
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.selector import (
+    SelectOptionDict,
+    SelectSelector,
+    SelectSelectorConfig,
+)
 
 from .const import (
     DOMAIN,
@@ -26,15 +35,26 @@ from .const import (
     CONF_RECYCLING_ICON,
     CONF_ALERT_HOURS,
     CONF_HAS_GREEN_BIN,
+    CONF_OFFLINE_MODE,
+    CONF_COMPACT_MODE,
+    CONF_EXPORT_URL,
     DEFAULT_SERVICE_NAME,
     DEFAULT_BASE_URL,
     DEFAULT_DAYS_TABLE,
     DEFAULT_WEEKS_TABLE,
+    DEFAULT_EXPORT_URL,
     DEFAULT_POLLING_INTERVAL_HOURS,
     DEFAULT_ICON,
     DEFAULT_ALERT_HOURS,
     MINIMUM_POLLING_INTERVAL_HOURS,
 )
+from .api import BccApiClient, BccApiError
+from .property_index import PropertyIndex, get_property_index
+from .ratelimit import get_rate_limiter
+
+_LOGGER = logging.getLogger(__name__)
+
+CONF_ADDRESS = 'address'
 
 OPTIONS_SCHEMA = vol.Schema(
     {
@@ -54,6 +74,10 @@ OPTIONS_SCHEMA = vol.Schema(
             CONF_WEEKS_TABLE,
             default=DEFAULT_WEEKS_TABLE
         ): cv.string,
+        vol.Optional(
+            CONF_EXPORT_URL,
+            default=DEFAULT_EXPORT_URL
+        ): cv.string,
         vol.Required(
             CONF_POLLING_INTERVAL_HOURS,
             default=DEFAULT_POLLING_INTERVAL_HOURS
@@ -75,14 +99,47 @@ OPTIONS_SCHEMA = vol.Schema(
             CONF_HAS_GREEN_BIN,
             default=False
         ): cv.boolean,
+        vol.Optional(
+            CONF_OFFLINE_MODE,
+            default=False
+        ): cv.boolean,
+        vol.Optional(
+            CONF_COMPACT_MODE,
+            default=False
+        ): cv.boolean,
+    }
+)
+
+# Only shown in advanced mode; the defaults suit everyone else.
+ADVANCED_OPTIONS = {CONF_EXPORT_URL}
+
+
+def _options_schema(show_advanced_options: bool) -> vol.Schema:
+    """Return the options schema, without the advanced options unless they're to be shown."""
+    if show_advanced_options:
+        return OPTIONS_SCHEMA
+    return vol.Schema({
+        key: value for key, value in OPTIONS_SCHEMA.schema.items()
+        if key not in ADVANCED_OPTIONS
+    })
+
+
+SEARCH_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_ADDRESS): cv.string,
     }
 )
 
+
 class BinDayConfigFlowHandler(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Brisbane Bin Day."""
 
     VERSION = 1
 
+    _build_task: asyncio.Task[None] | None = None
+    _matches: list[tuple[int, str]]
+    _property_number: int | None = None
+
     @staticmethod
     @callback
     def async_get_options_flow(config_entry: ConfigEntry) -> BinDayOptionFlowHandler:
@@ -93,8 +150,103 @@ class BinDayConfigFlowHandler(ConfigFlow, domain=DOMAIN):
         """Return True if other_flow matches this flow."""
         return other_flow.context.get("unique_id") == self.context.get("unique_id")
 
+    def _property_index(self) -> PropertyIndex:
+        """Return the index of the default days dataset to search addresses in."""
+        return get_property_index(self.hass, DEFAULT_EXPORT_URL, DEFAULT_DAYS_TABLE)
+
     async def async_step_user(self, user_input: dict[str, Any] | None = None) -> ConfigFlowResult:
         """Handle a flow initiated by the user."""
+        return self.async_show_menu(step_id="user", menu_options=["search", "manual"])
+
+    async def async_step_search(
+            self,
+            user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Search for the property by its address."""
+        index = self._property_index()
+        if not await index.async_is_built():
+            return await self.async_step_build_index()
+
+        errors = {}
+        if user_input is not None:
+            try:
+                self._matches = await index.async_search(user_input[CONF_ADDRESS])
+            except BccApiError:
+                _LOGGER.exception("Error searching the collection days dataset")
+                errors['base'] = 'cannot_search'
+            else:
+                if self._matches:
+                    return await self.async_step_pick()
+                errors['base'] = 'no_matches'
+
+        return self.async_show_form(step_id="search", data_schema=SEARCH_SCHEMA, errors=errors)
+
+    async def async_step_build_index(
+            self,
+            user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Download the collection days dataset to search, showing progress meanwhile."""
+        if self._build_task is None:
+            client = BccApiClient(
+                async_get_clientsession(self.hass),
+                DEFAULT_BASE_URL,
+                rate_limiter=get_rate_limiter(self.hass))
+            self._build_task = self.hass.async_create_task(
+                self._property_index().async_ensure_built(client))
+
+        if not self._build_task.done():
+            return self.async_show_progress(
+                step_id="build_index",
+                progress_action="build_index",
+                progress_task=self._build_task,
+            )
+
+        try:
+            self._build_task.result()
+        except BccApiError:
+            _LOGGER.exception("Error downloading the collection days dataset")
+            return self.async_show_progress_done(next_step_id="build_index_failed")
+        finally:
+            self._build_task = None
+
+        return self.async_show_progress_done(next_step_id="search")
+
+    async def async_step_build_index_failed(
+            self,
+            user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Give up when the dataset couldn't be downloaded."""
+        return self.async_abort(reason="cannot_build_index")
+
+    async def async_step_pick(
+            self,
+            user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Pick the property from the addresses found."""
+        if user_input is not None:
+            self._property_number = int(user_input[CONF_PROPERTY_NUMBER])
+            return await self.async_step_manual()
+
+        return self.async_show_form(
+            step_id="pick",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_PROPERTY_NUMBER): SelectSelector(
+                        SelectSelectorConfig(options=[
+                            SelectOptionDict(value=str(property_number), label=address)
+                            for property_number, address in self._matches
+                        ])
+                    ),
+                }
+            ),
+            errors={},
+        )
+
+    async def async_step_manual(
+            self,
+            user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Configure everything, with the property number from the search if any."""
         if user_input is not None:
             return self.async_create_entry(
                 title=user_input[CONF_SERVICE_NAME],
@@ -104,16 +256,27 @@ class BinDayConfigFlowHandler(ConfigFlow, domain=DOMAIN):
                     CONF_BASE_URL: user_input[CONF_BASE_URL],
                     CONF_DAYS_TABLE: user_input[CONF_DAYS_TABLE],
                     CONF_WEEKS_TABLE: user_input[CONF_WEEKS_TABLE],
+                    CONF_EXPORT_URL: user_input.get(CONF_EXPORT_URL, DEFAULT_EXPORT_URL),
                     CONF_POLLING_INTERVAL_HOURS: user_input[CONF_POLLING_INTERVAL_HOURS],
                     CONF_NORMAL_ICON: user_input[CONF_NORMAL_ICON],
                     CONF_RECYCLING_ICON: user_input[CONF_RECYCLING_ICON],
                     CONF_ALERT_HOURS: user_input[CONF_ALERT_HOURS],
                     CONF_PROPERTY_NUMBER: user_input[CONF_PROPERTY_NUMBER],
                     CONF_HAS_GREEN_BIN: user_input[CONF_HAS_GREEN_BIN],
+                    CONF_OFFLINE_MODE: user_input[CONF_OFFLINE_MODE],
+                    CONF_COMPACT_MODE: user_input[CONF_COMPACT_MODE],
                 },
             )
 
-        return self.async_show_form(step_id="user", data_schema=OPTIONS_SCHEMA, errors={})
+        schema = _options_schema(self.show_advanced_options)
+        return self.async_show_form(
+            step_id="manual",
+            data_schema=(
+                schema if self._property_number is None else
+                self.add_suggested_values_to_schema(
+                    schema, {CONF_PROPERTY_NUMBER: self._property_number})),
+            errors={},
+        )
 
 
 class BinDayOptionFlowHandler(OptionsFlow):
@@ -122,12 +285,17 @@ class BinDayOptionFlowHandler(OptionsFlow):
     async def async_step_init(self, user_input: dict[str, Any] | None = None) -> ConfigFlowResult:
         """Manage the options."""
         if user_input is not None:
-            return self.async_create_entry(data=user_input)
+            # Keep the advanced options set before, if they weren't shown.
+            advanced_options = {
+                key: value for key, value in self.config_entry.options.items()
+                if key in ADVANCED_OPTIONS
+            }
+            return self.async_create_entry(data={**advanced_options, **user_input})
 
         return self.async_show_form(
             step_id="init",
             data_schema=self.add_suggested_values_to_schema(
-                OPTIONS_SCHEMA, self.config_entry.options
+                _options_schema(self.show_advanced_options), self.config_entry.options
             ),
             errors={}
         )
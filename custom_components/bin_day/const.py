@@ -15,11 +15,18 @@ CONF_NORMAL_ICON: Final = 'normal_icon'
 CONF_RECYCLING_ICON: Final = 'recycling_icon'
 CONF_ALERT_HOURS: Final = 'alert_hours'
 CONF_HAS_GREEN_BIN: Final = 'has_green_bin'
+CONF_OFFLINE_MODE: Final = 'offline_mode'
+CONF_COMPACT_MODE: Final = 'compact_mode'
+CONF_EXPORT_URL: Final = 'export_url'
 
 DEFAULT_SERVICE_NAME: Final = 'Brisbane Bin Day'
 DEFAULT_BASE_URL: Final = (
     'https://www.data.brisbane.qld.gov.au/api/explore/v2.1/catalog/datasets/'
     '{dataset}/records?where={query}&limit=1')
+DEFAULT_EXPORT_URL: Final = (
+    'https://www.data.brisbane.qld.gov.au/api/explore/v2.1/catalog/datasets/'
+    '{dataset}/exports/jsonl'
+    '?select=property_id,suburb,street_name,house_number,collection_day,zone')
 DEFAULT_DAYS_TABLE: Final = 'waste-collection-days-collection-days'
 DEFAULT_WEEKS_TABLE: Final = 'waste-collection-days-collection-weeks'
 DEFAULT_ALERT_HOURS: Final = 12
@@ -27,3 +34,83 @@ DEFAULT_POLLING_INTERVAL_HOURS: Final = 24
 DEFAULT_ICON: Final = 'mdi:trash-can'
 
 MINIMUM_POLLING_INTERVAL_HOURS: Final = 6
+
+API_CONNECT_TIMEOUT_SECONDS: Final = 10
+API_READ_TIMEOUT_SECONDS: Final = 30
+# Opendatasoft caps 'limit' at 100 records per request.
+API_PAGE_SIZE: Final = 100
+
+DATA_BATCH_FETCHER: Final = f'{DOMAIN}_batch_fetcher'
+BATCH_CHUNK_SIZE: Final = API_PAGE_SIZE
+# Long enough that staggered polls of other entries are served from the last batch.
+BATCH_CACHE_SECONDS: Final = 3 * 3600
+
+# The weeks dataset is a calendar that's published well ahead.
+ZONE_SCHEDULE_TTL_SECONDS: Final = 30 * 24 * 3600
+
+STORAGE_VERSION: Final = 1
+STORAGE_MINOR_VERSION: Final = 3
+STORAGE_SAVE_DELAY_SECONDS: Final = 10
+
+DATA_PROPERTY_INDEXES: Final = f'{DOMAIN}_property_indexes'
+PROPERTY_INDEX_REFRESH_SECONDS: Final = 7 * 24 * 3600
+PROPERTY_INDEX_INSERT_BATCH_SIZE: Final = 1000
+ADDRESS_SEARCH_LIMIT: Final = 20
+
+DATA_RESPONSE_CACHE: Final = f'{DOMAIN}_response_cache'
+RESPONSE_CACHE_MAX_ENTRIES: Final = 1000
+
+# Refresh this long after the start of collection day, when the next
+# collection (and so the week the weeks dataset is queried for) rolls over.
+REFRESH_AFTER_COLLECTION_SECONDS: Final = 10 * 60
+DAYS_REFRESH_SECONDS: Final = 7 * 24 * 3600
+RETRY_BASE_SECONDS: Final = 5 * 60
+
+METRICS_HISTORY_SIZE: Final = 100
+
+CALENDAR_HORIZON_DAYS: Final = 365
+
+DATA_PROFILER: Final = f'{DOMAIN}_profiler'
+PROFILE_LAG_PROBE_SECONDS: Final = 0.05
+PROFILE_TOP_FUNCTIONS: Final = 50
+
+DATA_ZONE_SCHEDULES: Final = f'{DOMAIN}_zone_schedules'
+ZONE_SCHEDULES_MAX_ZONES: Final = 64
+
+DATA_STARTUP_REFRESHES: Final = f'{DOMAIN}_startup_refreshes'
+STARTUP_REFRESH_CONCURRENCY: Final = 8
+
+DATA_RATE_LIMITER: Final = f'{DOMAIN}_rate_limiter'
+API_RATE_LIMIT_PER_SECOND: Final = 2
+API_RATE_LIMIT_BURST: Final = 5
+
+# Options that only change presentation or derived values, so are applied to
+# the live data and entities; changing any other option reloads the entry.
+HOT_APPLIED_OPTIONS: Final = frozenset({
+    CONF_ALERT_HOURS,
+    CONF_HAS_GREEN_BIN,
+    CONF_NORMAL_ICON,
+    CONF_RECYCLING_ICON,
+    CONF_POLLING_INTERVAL_HOURS,
+})
+
+# The defaults of options added since the first release, which older
+# entries don't have until their options are next saved.
+ADDED_OPTION_DEFAULTS: Final = {
+    CONF_EXPORT_URL: DEFAULT_EXPORT_URL,
+    CONF_OFFLINE_MODE: False,
+    CONF_COMPACT_MODE: False,
+}
+
+SERVICE_GET_SCHEDULE: Final = 'get_schedule'
+SERVICE_GET_DUE_TIMES: Final = 'get_due_times'
+SERVICE_PROFILE: Final = 'profile'
+ATTR_PROPERTY_NUMBERS: Final = 'property_numbers'
+ATTR_COUNT: Final = 'count'
+ATTR_HAS_GREEN_BIN: Final = 'has_green_bin'
+ATTR_BIN_TIME_ONLY: Final = 'bin_time_only'
+ATTR_DURATION: Final = 'duration'
+DEFAULT_SCHEDULE_COUNT: Final = 4
+MAXIMUM_SCHEDULE_COUNT: Final = 52
+DEFAULT_PROFILE_SECONDS: Final = 60
+MAXIMUM_PROFILE_SECONDS: Final = 3600
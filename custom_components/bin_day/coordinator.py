@@ -2,15 +2,17 @@
 
 import asyncio
 import logging
+import random
 
-from datetime import timedelta
-from urllib.parse import quote_plus
-
-import pandas
-import requests
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from time import monotonic, perf_counter
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import (
@@ -19,24 +21,92 @@ from .const import (
     CONF_BASE_URL,
     CONF_DAYS_TABLE,
     CONF_WEEKS_TABLE,
+    CONF_SERVICE_NAME,
     CONF_PROPERTY_NUMBER,
     CONF_ALERT_HOURS,
     CONF_HAS_GREEN_BIN,
+    CONF_OFFLINE_MODE,
+    CONF_EXPORT_URL,
+    DEFAULT_EXPORT_URL,
+    REFRESH_AFTER_COLLECTION_SECONDS,
+    DAYS_REFRESH_SECONDS,
+    RETRY_BASE_SECONDS,
+    HOT_APPLIED_OPTIONS,
+    ADDED_OPTION_DEFAULTS,
 )
 
-from .data import BccApiData
+from .api import BccApiClient, BccApiError
+from .batch import get_batch_fetcher
+from .data import BccApiData, DaysRecord
+from .metrics import RefreshMetrics
+from .profiler import profiled
+from .property_index import PropertyIndex, get_property_index
+from .ratelimit import get_rate_limiter
+from .response_cache import get_response_cache
+from .schedule import ZoneSchedule
+from .scheduler import BinDayScheduler
+from .store import BinDayStore, create_store
+from .zones import get_zone_schedules
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass
+class StateWriteStats:
+    """Counts the state writes the entities of a coordinator made and skipped."""
+
+    emitted: int = 0
+    suppressed: int = 0
+
+
 class BccApiDataUpdateCoordinator(DataUpdateCoordinator[BccApiData]):
     """Coordinates requests to the BCC API."""
 
     _config: ConfigEntry
+    _client: BccApiClient
+    _zone_schedule: ZoneSchedule | None
+    _property_index: PropertyIndex | None
+    _consecutive_failures: int
+    _days_fetched_at: float | None
+    _recycling_week_key: tuple[str, date] | None
+    _applied_options: dict[str, Any]
+    _store: BinDayStore
+    scheduler: BinDayScheduler
+    device_info: DeviceInfo
+    write_stats: StateWriteStats
+    metrics: RefreshMetrics
 
     def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
         """Initialize the BCC API coordinator."""
         self._config = config_entry
+        self._applied_options = dict(config_entry.options)
+        self._zone_schedule = None
+        self._consecutive_failures = 0
+        self._days_fetched_at = None
+        self._recycling_week_key = None
+        self.metrics = RefreshMetrics()
+        self._store = create_store(hass, config_entry.entry_id)
+        self._client = BccApiClient(
+            async_get_clientsession(hass),
+            config_entry.options.get(CONF_BASE_URL),
+            get_response_cache(hass),
+            self.metrics,
+            get_rate_limiter(hass))
+
+        # In offline mode the days data comes from a local copy of the whole
+        # dataset, otherwise from live queries batched with the other entries.
+        if config_entry.options.get(CONF_OFFLINE_MODE):
+            self._property_index = get_property_index(
+                hass,
+                config_entry.options.get(CONF_EXPORT_URL, DEFAULT_EXPORT_URL),
+                config_entry.options.get(CONF_DAYS_TABLE))
+        else:
+            self._property_index = None
+            config_entry.async_on_unload(
+                get_batch_fetcher(hass).async_register(
+                    self._client,
+                    config_entry.options.get(CONF_DAYS_TABLE),
+                    config_entry.options.get(CONF_PROPERTY_NUMBER)))
 
         update_interval = config_entry.options.get(CONF_POLLING_INTERVAL_HOURS)
 
@@ -48,93 +118,234 @@ class BccApiDataUpdateCoordinator(DataUpdateCoordinator[BccApiData]):
             update_interval=timedelta(hours=update_interval)
         )
 
-    async def _async_update_data(self) -> BccApiData:
-        """Fetch the data from the BCC API and parse it and return it."""
-        _LOGGER.debug("Updating the BCC API data")
+        self.scheduler = BinDayScheduler(hass, self)
+        # One device for the entry, shared by all its entities.
+        self.device_info = DeviceInfo(
+            entry_type=DeviceEntryType.SERVICE,
+            identifiers={(DOMAIN, config_entry.entry_id)},
+            name=config_entry.options.get(CONF_SERVICE_NAME),
+        )
+        self.write_stats = StateWriteStats()
+
+    @property
+    def zone_schedule(self) -> ZoneSchedule | None:
+        """Return the schedule of the zone, if it's been fetched."""
+        return self._zone_schedule
+
+    @callback
+    def async_apply_options(self) -> bool:
+        """Apply changed options to the live data; returns False if a reload is needed."""
+        options = self._config.options
+        # An option an older entry didn't have is unchanged if it's saved as the default.
+        changed = {
+            key for key in self._applied_options.keys() | options.keys()
+            if (self._applied_options.get(key, ADDED_OPTION_DEFAULTS.get(key)) !=
+                options.get(key, ADDED_OPTION_DEFAULTS.get(key)))
+        }
+        if not changed <= HOT_APPLIED_OPTIONS:
+            return False
+
+        _LOGGER.debug("Applying changed options %s without reloading", sorted(changed))
+        self._applied_options = dict(options)
+
+        if (data := self.data) is not None:
+            data.alert_hours = options.get(CONF_ALERT_HOURS)
+            data.has_green_bin = options.get(CONF_HAS_GREEN_BIN)
+            data.polling_interval_hours = options.get(CONF_POLLING_INTERVAL_HOURS)
+            if self._consecutive_failures == 0 and data.collection_day_no is not None:
+                self.update_interval = self._next_update_interval(data)
+                # Move the refresh already scheduled, e.g. for a shorter interval.
+                self._schedule_refresh()
+
+        # Let the entities (and the scheduler) recompute from the changed data.
+        self.async_update_listeners()
+        return True
+
+    def _new_api_data(self) -> BccApiData:
+        """Create the data object, populated with the static config."""
+        return BccApiData(
+            self._config.options.get(CONF_PROPERTY_NUMBER),
+            self._config.options.get(CONF_ALERT_HOURS),
+            self._config.options.get(CONF_POLLING_INTERVAL_HOURS),
+            self._config.options.get(CONF_HAS_GREEN_BIN),
+        )
 
+    async def async_restore(self) -> bool:
+        """Publish the data saved by the last good refresh; returns whether there was any."""
+        snapshot = await self._store.async_load_snapshot(
+            self._config.options.get(CONF_PROPERTY_NUMBER))
+        if snapshot is None or snapshot[0] is None:
+            return False
+
+        days_record, zone_schedule = snapshot
+        if zone_schedule is not None:
+            self._zone_schedule = get_zone_schedules(self.hass).async_seed(
+                self._client, self._config.options.get(CONF_WEEKS_TABLE), zone_schedule)
+
+        api_data = self._new_api_data()
+        api_data.apply_days_record(days_record)
+
+        # The recycling week comes from the schedule, if it covers the week
+        # of the next collection; otherwise it's unknown until the first refresh.
+        week_start_date = api_data.collection_week_start()
+        schedule = self._zone_schedule
+        if (schedule is not None and schedule.zone == str(api_data.collection_zone) and
+                schedule.covers(week_start_date)):
+            api_data.recycling_week = schedule.is_recycling_week(week_start_date)
+            self._recycling_week_key = (schedule.zone, week_start_date)
+
+        _LOGGER.debug("Restored the BCC API data for property %s", api_data.property_number)
+        self.async_set_updated_data(api_data)
+        return True
+
+    @profiled('refresh')
+    async def _async_update_data(self) -> BccApiData:
+        """Fetch what may have changed from the BCC API and merge it into the previous data.
+
+        The days record is refetched on a slow cadence and the recycling week
+        only looked up when the week of the next collection moves on.  What
+        fails to be fetched keeps its last known good value.
+        """
+        cache_stats = get_response_cache(self.hass).stats
+        _LOGGER.debug(
+            "Updating the BCC API data; state writes so far: %d emitted, %d suppressed; "
+            "responses so far: %d cache hits, %d misses, %d revalidations",
+            self.write_stats.emitted, self.write_stats.suppressed,
+            cache_stats.hits, cache_stats.misses, cache_stats.revalidations)
+
+        started = perf_counter()
         property_number = self._config.options.get(CONF_PROPERTY_NUMBER)
-        alert_hours = self._config.options.get(CONF_ALERT_HOURS)
-        polling_interval_hours = self._config.options.get(CONF_POLLING_INTERVAL_HOURS)
-        has_green_bin = self._config.options.get(CONF_HAS_GREEN_BIN)
-        api_data = BccApiData(property_number, alert_hours, polling_interval_hours, has_green_bin)
+        api_data = self._new_api_data()
 
-        base_url = self._config.options.get(CONF_BASE_URL)
         days_table = self._config.options.get(CONF_DAYS_TABLE)
         weeks_table = self._config.options.get(CONF_WEEKS_TABLE)
 
-        loop = asyncio.get_running_loop()
-        await loop.run_in_executor(
-            None, self._get_days_data, base_url, days_table, property_number, api_data)
-        await loop.run_in_executor(
-            None, self._get_weeks_data, base_url, weeks_table, api_data)
+        # The recycling flag is only carried over while it's for the same
+        # zone and week; _async_get_weeks_data checks that.
+        previous = self.data
+        if previous is not None and previous.collection_day_no is not None:
+            api_data.apply_days_record(previous.days_record())
+            api_data.recycling_week = previous.recycling_week
+
+        ok = True
+        if self._days_fetched_at is None or (
+                monotonic() - self._days_fetched_at >= DAYS_REFRESH_SECONDS):
+            # The zone hardly ever changes, so once it's known fetch its
+            # schedule alongside the days data; the weeks step below then only
+            # needs to go to the network if the zone or collection day did change.
+            if api_data.collection_day_no is not None:
+                record, _ = await asyncio.gather(
+                    self._async_get_days_data(days_table, property_number),
+                    self._async_prefetch_zone_schedule(weeks_table, api_data),
+                )
+            else:
+                record = await self._async_get_days_data(days_table, property_number)
+            if record is not None:
+                api_data.apply_days_record(record)
+                self._days_fetched_at = monotonic()
+            else:
+                ok = False
+
+        ok = await self._async_get_weeks_data(weeks_table, api_data) and ok
+
+        if ok and api_data.recycling_week is not None:
+            self._consecutive_failures = 0
+            self._store.async_save_snapshot(
+                property_number, api_data.days_record(), self._zone_schedule)
+        else:
+            self._consecutive_failures += 1
+
+        self.metrics.record_refresh(perf_counter() - started, ok)
+        self.update_interval = self._next_update_interval(api_data)
+        _LOGGER.debug("Next BCC API update in %s", self.update_interval)
 
         return api_data
 
-    def _get_days_data(self, base_url, days_table, property_number, api_data):
-        """Fetch the data that the days table provides."""
+    def _next_update_interval(self, api_data: BccApiData) -> timedelta:
+        """Plan the next refresh from the data, with the configured interval as a ceiling.
+
+        After a failure, retry with exponential backoff and jitter.  Otherwise
+        refresh shortly after the next collection day starts, which is when the
+        week the recycling depends on moves on.
+        """
+        ceiling = timedelta(hours=self._config.options.get(CONF_POLLING_INTERVAL_HOURS))
+
+        if self._consecutive_failures > 0:
+            backoff = RETRY_BASE_SECONDS * 2 ** (self._consecutive_failures - 1)
+            backoff = min(backoff, ceiling.total_seconds())
+            return timedelta(seconds=backoff / 2 + random.uniform(0, backoff / 2))
+
+        until_rollover = (
+            api_data.next_collection_date() - datetime.now() +
+            timedelta(seconds=REFRESH_AFTER_COLLECTION_SECONDS)
+        )
+        return min(ceiling, until_rollover)
+
+    @profiled('days_data')
+    async def _async_get_days_data(self, days_table, property_number) -> DaysRecord | None:
+        """Fetch the data that the days table provides, batched with other entries."""
 
         try:
-            full_url = base_url.format(**{
-                'dataset': days_table,
-                'query': quote_plus(f"property_id={property_number}")
-            })
-
-            response = requests.get(full_url, timeout=60)
-            json=response.json()
-
-            if 'error_code' in json:
-                _LOGGER.error(
-                    "Error retrieving collection day dataset: %s: %s",
-                    json['error_code'], json['message'])
+            if self._property_index is not None:
+                await self._property_index.async_ensure_built(self._client)
+                record = await self._property_index.async_lookup(property_number)
             else:
-                dic = json['results']
-                df = pandas.DataFrame(dic)
-
-                if len(df.index) > 0:
-                    api_data.suburb = df['suburb'].iloc[0]
-                    api_data.street_name = df['street_name'].iloc[0]
-                    api_data.house_number = df['house_number'].iloc[0]
-                    api_data.collection_day = df['collection_day'].iloc[0]
-                    api_data.collection_zone = df['zone'].iloc[0]
-                else:
-                    _LOGGER.error('Collection day dataset zero rows returned')
-
-        except requests.exceptions.RequestException:
+                record = await get_batch_fetcher(self.hass).async_get_days_record(
+                    self._client, days_table, property_number)
+        except BccApiError:
             _LOGGER.exception("Error requesting collection day data")
+            return None
+
+        if record is None:
+            _LOGGER.error('Collection day dataset zero rows returned')
+        return record
 
-    def _get_weeks_data(self, base_url, weeks_table, api_data):
-        """Fetch the data that the weeks table provides.""" 
+    @profiled('weeks_data')
+    async def _async_get_weeks_data(self, weeks_table, api_data) -> bool:
+        """Look up the recycling week, unless it's still the same week; returns False on failure."""
 
         # Handle the getting of the days data failing for any reason.
         if api_data.collection_day is None:
-            return
+            return False
 
-        week_start_date = (
-            api_data.next_collection_date() -
-            timedelta(days=api_data.collection_week_day())
-        )
-        query_date = f'{week_start_date:%Y-%m-%d}'.replace("'", "\\'")
-        query_zone = str(api_data.collection_zone).replace("'", "\\'")
-        query = f"week_starting=date'{query_date}' AND search(zone,'{query_zone}')"
-
-        try:
-            full_url = base_url.format(**{
-                'dataset': weeks_table,
-                'query': quote_plus(query)
-            })
-
-            response = requests.get(full_url, timeout=60)
-            json=response.json()
-
-            if 'error_code' in json:
-                _LOGGER.error(
-                    "Error retrieving collection week dataset: %s: %s",
-                    json['error_code'], json['message'])
-            else:
-                dic = json['results']
-                df = pandas.DataFrame(dic)
+        week_start_date = api_data.collection_week_start()
+        zone = str(api_data.collection_zone)
+        key = (zone, week_start_date)
+        if key == self._recycling_week_key and api_data.recycling_week is not None:
+            return True
 
-                api_data.recycling_week = len(df.index) > 0
+        # The flag carried over is for another week, and recycling weeks
+        # alternate, so it's no good even as a fallback.
+        api_data.recycling_week = None
+        self._recycling_week_key = None
 
-        except requests.exceptions.RequestException:
+        try:
+            schedule = await self._async_get_zone_schedule(weeks_table, zone, week_start_date)
+        except BccApiError:
             _LOGGER.exception("Error requesting collection week data")
+            # An expired schedule still knows the weeks it was fetched for.
+            schedule = get_zone_schedules(self.hass).async_get_cached(
+                self._client, weeks_table, zone)
+            if schedule is not None and schedule.covers(week_start_date):
+                api_data.recycling_week = schedule.is_recycling_week(week_start_date)
+                self._recycling_week_key = key
+            return False
+
+        api_data.recycling_week = schedule.is_recycling_week(week_start_date)
+        self._recycling_week_key = key
+        return True
+
+    async def _async_prefetch_zone_schedule(self, weeks_table, previous):
+        """Make sure the schedule of the previously fetched zone is cached."""
+        try:
+            await self._async_get_zone_schedule(
+                weeks_table, str(previous.collection_zone), previous.collection_week_start())
+        except BccApiError as err:
+            # The weeks step retries and reports it.
+            _LOGGER.debug("Error prefetching collection week data: %s", err)
+
+    async def _async_get_zone_schedule(self, weeks_table, zone, week_start_date) -> ZoneSchedule:
+        """Return the zone's schedule, shared with other entries in the same zone."""
+        self._zone_schedule = await get_zone_schedules(self.hass).async_get(
+            self._client, weeks_table, zone, week_start_date)
+        return self._zone_schedule
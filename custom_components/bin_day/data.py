@@ -3,12 +3,70 @@
 from __future__ import annotations
 
 import math
+import sys
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, date
 from time import strptime
+from typing import Any, NamedTuple
 
-@dataclass
+
+def _intern(value: Any) -> Any:
+    """Return the one shared copy of a string, which is repeated across many properties."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class DaysRecord(NamedTuple):
+    """One record of the collection days dataset's 'results'."""
+
+    suburb: str
+    street_name: str
+    house_number: str
+    collection_day: str
+    collection_zone: str
+
+    @classmethod
+    def interned(
+            cls,
+            suburb: str,
+            street_name: str,
+            house_number: str,
+            collection_day: str,
+            collection_zone: str
+    ) -> DaysRecord:
+        """Create a record whose strings are shared with every other record with them."""
+        return cls(
+            suburb=_intern(suburb),
+            street_name=_intern(street_name),
+            house_number=_intern(house_number),
+            collection_day=_intern(collection_day),
+            collection_zone=_intern(collection_zone),
+        )
+
+    @classmethod
+    def from_result(cls, result: dict[str, Any]) -> DaysRecord:
+        """Parse a record from the decoded JSON of the BCC API."""
+        return cls.interned(
+            suburb=result['suburb'],
+            street_name=result['street_name'],
+            house_number=result['house_number'],
+            collection_day=result['collection_day'],
+            collection_zone=result['zone'],
+        )
+
+
+class BinDaySnapshot(NamedTuple):
+    """The values derived from BccApiData at one point in time."""
+
+    next_collection_date: datetime | None
+    due_in_hours: int | None
+    is_bin_time: bool | None
+    extra_bin_text: str | None
+    is_recycling_week: bool
+    is_green_waste_week: bool
+
+
+@dataclass(slots=True)
 class BccApiData:
     """Object holding the data about waste collection received."""
     # pylint: disable=too-many-instance-attributes
@@ -25,6 +83,10 @@ class BccApiData:
     collection_day: str
     collection_zone: str
     recycling_week: bool
+    # Derived, cached.
+    collection_day_no: int | None
+    _snapshot_key: tuple | None = field(compare=False, repr=False)
+    _snapshot: BinDaySnapshot | None = field(compare=False, repr=False)
 
     def __init__(
             self,
@@ -44,33 +106,90 @@ class BccApiData:
         self.collection_day = None
         self.collection_zone = None
         self.recycling_week = None
+        self.collection_day_no = None
+        self._snapshot_key = None
+        self._snapshot = None
 
-    def collection_week_day(self) -> int | None:
-        """Compute the week day number of our collection day."""
+    def apply_days_record(self, record: DaysRecord) -> None:
+        """Copy the fields fetched from the days dataset into this object."""
+        self.suburb = record.suburb
+        self.street_name = record.street_name
+        self.house_number = record.house_number
+        self.collection_day = record.collection_day
+        self.collection_zone = record.collection_zone
+        # Parse the day name once, here, rather than every time it's used.
+        self.collection_day_no = strptime(record.collection_day, '%A').tm_wday
+
+    def days_record(self) -> DaysRecord | None:
+        """Return the fields fetched from the days dataset, if they have been."""
         return (None if self.collection_day is None else
-                strptime(self.collection_day, '%A').tm_wday)
+                DaysRecord(
+                    suburb=self.suburb,
+                    street_name=self.street_name,
+                    house_number=self.house_number,
+                    collection_day=self.collection_day,
+                    collection_zone=self.collection_zone,
+                ))
+
+    def collection_week_day(self) -> int | None:
+        """Return the week day number of our collection day."""
+        return self.collection_day_no
+
+    def snapshot(self, now: datetime | None = None) -> BinDaySnapshot:
+        """Compute the derived values, shared by every reader within the same minute."""
+        if now is None:
+            now = datetime.now()
+
+        # Everything the snapshot depends on, so that changing any of it
+        # (e.g. a refresh or an option) computes a new one.
+        key = (now.replace(second=0, microsecond=0), self.collection_day_no,
+               self.alert_hours, self.has_green_bin, self.recycling_week)
+        if key != self._snapshot_key:
+            next_collection_date = self.next_collection_date(now)
+            due_in_hours = self.due_in_hours(now)
+            self._snapshot = BinDaySnapshot(
+                next_collection_date=next_collection_date,
+                due_in_hours=due_in_hours,
+                is_bin_time=None if due_in_hours is None else due_in_hours <= self.alert_hours,
+                extra_bin_text=self.extra_bin_text(),
+                is_recycling_week=self.is_recycling_week(),
+                is_green_waste_week=self.is_green_waste_week(),
+            )
+            self._snapshot_key = key
+        return self._snapshot
 
-    def is_bin_time(self) -> bool:
+    def is_bin_time(self, now: datetime | None = None) -> bool:
         """Compute whether it's time to take the bins out."""
-        return self.due_in_hours() <= self.alert_hours
+        return self.due_in_hours(now) <= self.alert_hours
 
-    def next_collection_date(self) -> datetime | None:
+    def next_collection_date(self, now: datetime | None = None) -> datetime | None:
         """Compute the date of the next collection from our collection day."""
-        collection_day_no = self.collection_week_day()
+        collection_day_no = self.collection_day_no
         if collection_day_no is None:
             return None
-        current_day_no = datetime.today().weekday()
+        if now is None:
+            now = datetime.now()
+        current_day_no = now.weekday()
         days_offset = 0 if collection_day_no > current_day_no else 7
         days_to_next_collection = days_offset + collection_day_no - current_day_no
-        date_today = datetime.combine(date.today(), datetime.min.time())
+        date_today = datetime.combine(now.date(), datetime.min.time())
         return date_today + timedelta(days=days_to_next_collection)
 
-    def due_in_hours(self) -> int | None:
+    def collection_week_start(self, now: datetime | None = None) -> date | None:
+        """Compute the start (Monday) of the week of the next collection."""
+        next_collection_date = self.next_collection_date(now)
+        if next_collection_date is None:
+            return None
+        return (next_collection_date - timedelta(days=self.collection_day_no)).date()
+
+    def due_in_hours(self, now: datetime | None = None) -> int | None:
         """Compute when the next bin collection is due, in hours from now."""
-        next_collection_date = self.next_collection_date()
+        if now is None:
+            now = datetime.now()
+        next_collection_date = self.next_collection_date(now)
         if next_collection_date is None:
             return None
-        diff = next_collection_date - datetime.now()
+        diff = next_collection_date - now
         return math.ceil(diff.seconds / 3600) + diff.days * 24
 
     def extra_bin_text(self) -> str | None:
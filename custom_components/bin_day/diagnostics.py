@@ -0,0 +1,39 @@
+"""Diagnostics support for Brisbane Bin Day."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, CONF_PROPERTY_NUMBER
+from .coordinator import BccApiDataUpdateCoordinator
+from .response_cache import get_response_cache
+
+# The property number identifies the address.
+TO_REDACT = {CONF_PROPERTY_NUMBER, 'property_number', 'house_number', 'street_name'}
+
+
+async def async_get_config_entry_diagnostics(
+        hass: HomeAssistant,
+        entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: BccApiDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    data = coordinator.data
+
+    return {
+        'options': async_redact_data(dict(entry.options), TO_REDACT),
+        'data': None if data is None else async_redact_data(
+            {field: getattr(data, field) for field in data.__dataclass_fields__
+             if not field.startswith('_')},
+            TO_REDACT),
+        'last_update_success': coordinator.last_update_success,
+        'update_interval': str(coordinator.update_interval),
+        'metrics': coordinator.metrics.as_dict(),
+        'state_writes': asdict(coordinator.write_stats),
+        'response_cache': asdict(get_response_cache(hass).stats),
+    }
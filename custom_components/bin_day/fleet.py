@@ -0,0 +1,119 @@
+"""Due times of many properties at once."""
+
+from __future__ import annotations
+
+import logging
+
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any, NamedTuple
+
+from .data import BccApiData
+
+_LOGGER = logging.getLogger(__name__)
+
+# Collection day number of a property whose days data hasn't been fetched.
+UNKNOWN_DAY = -1
+
+MICROSECONDS_PER_SECOND = 1_000_000
+SECONDS_PER_HOUR = 3600
+SECONDS_PER_DAY = 24 * SECONDS_PER_HOUR
+
+
+class FleetDueTimes(NamedTuple):
+    """The due times of every property of a FleetSchedule, in the same order.
+
+    Entries for properties whose collection day is unknown are None.
+    """
+
+    property_numbers: list[int]
+    next_collection_dates: list[datetime | None]
+    due_in_hours: list[int | None]
+    is_bin_time: list[bool | None]
+
+
+class FleetSchedule:
+    """The collection days and alert hours of many properties, stored as columns.
+
+    Computes the next collection, due hours and bin time of every property
+    in one pass, with the same results as BccApiData's methods.  NumPy is
+    imported only when a schedule is computed, and the per-property methods
+    are used instead if it isn't installed.
+    """
+
+    property_numbers: list[int]
+    _data: list[BccApiData]
+    _columns: tuple[Any, Any] | None
+
+    def __init__(self, data: Iterable[BccApiData]) -> None:
+        """Take the data of each property."""
+        self._data = list(data)
+        self.property_numbers = [api_data.property_number for api_data in self._data]
+        self._columns = None
+
+    def __len__(self) -> int:
+        """Return the number of properties."""
+        return len(self._data)
+
+    def due_times(self, now: datetime | None = None) -> FleetDueTimes:
+        """Compute the due times of every property at the given (naive, local) time."""
+        if now is None:
+            now = datetime.now()
+        try:
+            import numpy  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            _LOGGER.debug("NumPy isn't installed, computing %d due times one by one", len(self))
+            return self._due_times_one_by_one(now)
+        return self._due_times_vectorized(numpy, now)
+
+    def _due_times_one_by_one(self, now: datetime) -> FleetDueTimes:
+        """Compute the due times with the methods of each property's data."""
+        due_in_hours = [api_data.due_in_hours(now) for api_data in self._data]
+        return FleetDueTimes(
+            property_numbers=self.property_numbers,
+            next_collection_dates=[api_data.next_collection_date(now) for api_data in self._data],
+            due_in_hours=due_in_hours,
+            is_bin_time=[
+                None if due is None else due <= api_data.alert_hours
+                for api_data, due in zip(self._data, due_in_hours, strict=True)
+            ],
+        )
+
+    def _due_times_vectorized(self, np: Any, now: datetime) -> FleetDueTimes:
+        """Compute the due times with array arithmetic over every property."""
+        if self._columns is None:
+            self._columns = (
+                np.array([UNKNOWN_DAY if api_data.collection_day_no is None else
+                          api_data.collection_day_no for api_data in self._data],
+                         dtype=np.int8),
+                np.array([api_data.alert_hours for api_data in self._data], dtype=np.int32),
+            )
+        day_nos, alert_hours = self._columns
+        unknown = day_nos == UNKNOWN_DAY
+
+        # As in BccApiData.next_collection_date: later this week, else next week.
+        current_day_no = now.weekday()
+        days_to_next = np.where(day_nos > current_day_no, 0, 7) + day_nos - current_day_no
+        next_collection = (
+            np.datetime64(now.date(), 'us') + days_to_next.astype('timedelta64[D]'))
+
+        # As in BccApiData.due_in_hours, which ignores the microseconds.
+        seconds = (next_collection - np.datetime64(now, 'us')).astype(np.int64)
+        seconds //= MICROSECONDS_PER_SECOND
+        due_in_hours = (
+            seconds // SECONDS_PER_DAY * 24 +
+            -(-(seconds % SECONDS_PER_DAY) // SECONDS_PER_HOUR))
+        is_bin_time = due_in_hours <= alert_hours
+
+        def _with_unknown(values: Any) -> list:
+            """Return the values as Python objects, with None for unknown days."""
+            values = values.astype(object)
+            values[unknown] = None
+            return values.tolist()
+
+        return FleetDueTimes(
+            property_numbers=self.property_numbers,
+            next_collection_dates=_with_unknown(next_collection),
+            due_in_hours=_with_unknown(due_in_hours),
+            is_bin_time=_with_unknown(is_bin_time),
+        )
@@ -0,0 +1,125 @@
+"""Timings and outcomes of the requests made to the BCC API."""
+
+from __future__ import annotations
+
+import math
+
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+from enum import StrEnum
+from typing import Any
+
+from .const import METRICS_HISTORY_SIZE
+
+
+class FailureCategory(StrEnum):
+    """Why a request failed."""
+
+    TIMEOUT = 'timeout'
+    CONNECTION = 'connection'
+    HTTP = 'http'
+    API = 'api'
+    PARSE = 'parse'
+
+
+class CacheOutcome(StrEnum):
+    """How the response cache served a request."""
+
+    HIT = 'hit'
+    MISS = 'miss'
+    REVALIDATED = 'revalidated'
+
+
+@dataclass(slots=True)
+class FetchSample:
+    """One request to the BCC API, filled in as it progresses."""
+
+    dataset: str
+    started_at: float
+    # Until the response headers arrived, which includes DNS and connecting.
+    response_seconds: float | None = None
+    total_seconds: float | None = None
+    payload_bytes: int | None = None
+    parse_seconds: float | None = None
+    cache: CacheOutcome | None = None
+    failure: FailureCategory | None = None
+
+
+def percentile(values: Iterable[float], fraction: float) -> float | None:
+    """Return the nearest-rank percentile of the values, or None if there are none."""
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+class SharedFetchMetrics:
+    """Records requests made on behalf of several coordinators in each of their metrics."""
+
+    _metrics: tuple[RefreshMetrics, ...]
+
+    def __init__(self, metrics: Iterable[RefreshMetrics]) -> None:
+        """Initialize with the metrics of every coordinator the requests are for."""
+        self._metrics = tuple(metrics)
+
+    def record_fetch(self, sample: FetchSample) -> None:
+        """Add a finished request to every coordinator's history."""
+        for metrics in self._metrics:
+            metrics.record_fetch(sample)
+
+
+class RefreshMetrics:
+    """Rolling history of a coordinator's refreshes and the requests they made.
+
+    Both histories are bounded ring buffers, so percentiles are over the
+    most recent METRICS_HISTORY_SIZE entries.
+    """
+
+    fetches: deque[FetchSample]
+    refresh_seconds: deque[float]
+    refresh_failures: int
+
+    def __init__(self) -> None:
+        """Initialize empty histories."""
+        self.fetches = deque(maxlen=METRICS_HISTORY_SIZE)
+        self.refresh_seconds = deque(maxlen=METRICS_HISTORY_SIZE)
+        self.refresh_failures = 0
+
+    def record_fetch(self, sample: FetchSample) -> None:
+        """Add a finished request to the history."""
+        self.fetches.append(sample)
+
+    def record_refresh(self, seconds: float, succeeded: bool) -> None:
+        """Add a finished refresh to the history."""
+        self.refresh_seconds.append(seconds)
+        if not succeeded:
+            self.refresh_failures += 1
+
+    def last_refresh_seconds(self) -> float | None:
+        """Return how long the last refresh took."""
+        return self.refresh_seconds[-1] if self.refresh_seconds else None
+
+    def api_latency(self, fraction: float) -> float | None:
+        """Return the given percentile of the time requests that went to the API took."""
+        return percentile(
+            (sample.total_seconds for sample in self.fetches
+             if sample.cache is not CacheOutcome.HIT and sample.total_seconds is not None),
+            fraction)
+
+    def fetch_failures(self) -> int:
+        """Return how many of the recent requests failed."""
+        return sum(1 for sample in self.fetches if sample.failure is not None)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a summary and the raw history, e.g. for diagnostics."""
+        return {
+            'last_refresh_seconds': self.last_refresh_seconds(),
+            'refresh_seconds_p50': percentile(self.refresh_seconds, 0.5),
+            'refresh_seconds_p95': percentile(self.refresh_seconds, 0.95),
+            'refresh_failures': self.refresh_failures,
+            'api_latency_p50': self.api_latency(0.5),
+            'api_latency_p95': self.api_latency(0.95),
+            'fetch_failures': self.fetch_failures(),
+            'fetches': [asdict(sample) for sample in self.fetches],
+        }
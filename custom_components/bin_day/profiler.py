@@ -0,0 +1,182 @@
+"""On-demand profiling of the refreshes and sensor updates."""
+
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import functools
+import io
+import logging
+import pstats
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from time import perf_counter, thread_time
+from typing import Any, TypeVar
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_call_later
+
+from .const import DOMAIN, DATA_PROFILER, PROFILE_LAG_PROBE_SECONDS, PROFILE_TOP_FUNCTIONS
+
+_LOGGER = logging.getLogger(__name__)
+
+_FuncT = TypeVar('_FuncT', bound=Callable[..., Any])
+
+
+@callback
+def get_profiler(hass: HomeAssistant) -> BinDayProfiler:
+    """Return the profiler shared by every config entry."""
+    if DATA_PROFILER not in hass.data:
+        hass.data[DATA_PROFILER] = BinDayProfiler(hass)
+    return hass.data[DATA_PROFILER]
+
+
+def profiled(name: str) -> Callable[[_FuncT], _FuncT]:
+    """Time each call of a method of an object with 'hass', while profiling."""
+
+    def decorator(func: _FuncT) -> _FuncT:
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                if (session := get_profiler(self.hass).session) is None:
+                    return await func(self, *args, **kwargs)
+                with session.measure(name):
+                    return await func(self, *args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if (session := get_profiler(self.hass).session) is None:
+                return func(self, *args, **kwargs)
+            with session.measure(name):
+                return func(self, *args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+@dataclass
+class CallStats:
+    """The time spent in the calls of one hot path.
+
+    CPU time is that of the event loop's thread, so for coroutines it
+    includes whatever else ran on the loop while they were suspended.
+    """
+
+    calls: int = 0
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    max_wall_seconds: float = 0.0
+
+    def add(self, wall_seconds: float, cpu_seconds: float) -> None:
+        """Add a call."""
+        self.calls += 1
+        self.wall_seconds += wall_seconds
+        self.cpu_seconds += cpu_seconds
+        self.max_wall_seconds = max(self.max_wall_seconds, wall_seconds)
+
+
+@dataclass
+class ProfileSession:
+    """What's collected over one profiling window."""
+
+    started: datetime
+    profile: cProfile.Profile
+    calls: dict[str, CallStats] = field(default_factory=dict)
+    # How late the loop ran probes scheduled every PROFILE_LAG_PROBE_SECONDS.
+    loop_lag: CallStats = field(default_factory=CallStats)
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        """Time the enclosed call of the named hot path."""
+        wall_started = perf_counter()
+        cpu_started = thread_time()
+        try:
+            yield
+        finally:
+            self.calls.setdefault(name, CallStats()).add(
+                perf_counter() - wall_started, thread_time() - cpu_started)
+
+    def report(self) -> str:
+        """Summarize the hot paths, the loop lag and the busiest functions."""
+        lines = [f"{DOMAIN} profile from {self.started:%Y-%m-%d %H:%M:%S}", ""]
+        lines.append(f"{'hot path':<24}{'calls':>8}{'wall s':>12}{'cpu s':>12}{'max wall s':>12}")
+        for name, stats in sorted(self.calls.items()):
+            lines.append(
+                f"{name:<24}{stats.calls:>8}{stats.wall_seconds:>12.6f}"
+                f"{stats.cpu_seconds:>12.6f}{stats.max_wall_seconds:>12.6f}")
+        lines.append(
+            f"{'event loop lag':<24}{self.loop_lag.calls:>8}"
+            f"{self.loop_lag.wall_seconds:>12.6f}{'':>12}{self.loop_lag.max_wall_seconds:>12.6f}")
+        lines.append("")
+
+        stream = io.StringIO()
+        pstats.Stats(self.profile, stream=stream).sort_stats(
+            pstats.SortKey.CUMULATIVE).print_stats(PROFILE_TOP_FUNCTIONS)
+        lines.append(stream.getvalue())
+        return "\n".join(lines)
+
+
+class BinDayProfiler:
+    """Profiles the event loop for a window of time, on request.
+
+    While no window is open the hot paths only check that 'session' is None.
+    """
+
+    session: ProfileSession | None
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize a profiler that isn't profiling."""
+        self.hass = hass
+        self.session = None
+
+    @callback
+    def async_start(self, duration_seconds: float) -> None:
+        """Start profiling, and write the results to the config directory after the duration."""
+        if self.session is not None:
+            raise HomeAssistantError("Already profiling")
+
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError as err:
+            # Only one profiler can be active at a time, e.g. not as well as HA's own.
+            raise HomeAssistantError(f"Can't start profiling: {err}") from err
+
+        session = self.session = ProfileSession(datetime.now(), profile)
+        _LOGGER.info("Profiling for %s seconds", duration_seconds)
+
+        loop = self.hass.loop
+
+        def _probe(expected: float) -> None:
+            """Record how late the loop ran this probe, then schedule the next."""
+            if self.session is session:
+                now = loop.time()
+                session.loop_lag.add(max(0.0, now - expected), 0.0)
+                loop.call_at(now + PROFILE_LAG_PROBE_SECONDS, _probe,
+                             now + PROFILE_LAG_PROBE_SECONDS)
+
+        start = loop.time() + PROFILE_LAG_PROBE_SECONDS
+        loop.call_at(start, _probe, start)
+
+        async_call_later(self.hass, duration_seconds, self._async_stop)
+
+    async def _async_stop(self, _now: datetime) -> None:
+        """Stop profiling and write the profile and a summary of it."""
+        session, self.session = self.session, None
+        session.profile.disable()
+
+        base_path = self.hass.config.path(f"{DOMAIN}_profile_{session.started:%Y%m%d_%H%M%S}")
+        await self.hass.async_add_executor_job(self._write, session, base_path)
+        _LOGGER.info("Wrote the profile to %s.pstats and %s.txt", base_path, base_path)
+
+    @staticmethod
+    def _write(session: ProfileSession, base_path: str) -> None:
+        """Write the raw profile, for snakeviz and the like, and the summary."""
+        session.profile.dump_stats(f"{base_path}.pstats")
+        with open(f"{base_path}.txt", "w", encoding="utf-8") as file:
+            file.write(session.report())
@@ -0,0 +1,278 @@
+"""A local index of the collection days dataset, keyed by property number."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+
+from contextlib import closing
+from time import time
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import STORAGE_DIR
+from homeassistant.util import slugify
+
+from .api import BccApiClient, BccApiError
+from .const import (
+    DOMAIN,
+    DATA_PROPERTY_INDEXES,
+    PROPERTY_INDEX_REFRESH_SECONDS,
+    PROPERTY_INDEX_INSERT_BATCH_SIZE,
+    ADDRESS_SEARCH_LIMIT,
+    RETRY_BASE_SECONDS,
+)
+from .data import DaysRecord
+
+_LOGGER = logging.getLogger(__name__)
+
+# Bump when _SCHEMA changes, so that older index files get rebuilt.
+_SCHEMA_VERSION = 2
+_SCHEMA = (
+    'CREATE TABLE meta (key TEXT PRIMARY KEY, value)',
+    'CREATE TABLE property ('
+    ' property_id INTEGER PRIMARY KEY,'
+    ' suburb TEXT, street_name TEXT, house_number TEXT,'
+    ' collection_day TEXT, zone TEXT'
+    ') WITHOUT ROWID',
+    # Normalized address keys, searched by prefix with a range scan.
+    'CREATE TABLE address ('
+    ' key TEXT, property_id INTEGER,'
+    ' PRIMARY KEY (key, property_id)'
+    ') WITHOUT ROWID',
+)
+
+_NOT_SEARCHABLE = re.compile(r'[^\w ]+')
+
+
+def normalize_address(text: str) -> str:
+    """Normalize (part of) an address for prefix searches."""
+    return ' '.join(_NOT_SEARCHABLE.sub(' ', text.casefold()).split())
+
+
+def _address_keys(row: tuple) -> tuple[str, str]:
+    """Return the keys a property can be found by: from its number or its street."""
+    _, suburb, street_name, house_number, _, _ = row
+    return (
+        normalize_address(f"{house_number} {street_name} {suburb}"),
+        normalize_address(f"{street_name} {suburb} {house_number}"),
+    )
+
+
+@callback
+def get_property_index(hass: HomeAssistant, export_url: str, days_table: str) -> PropertyIndex:
+    """Return the index of the given days dataset, shared by every config entry."""
+    indexes: dict[tuple[str, str], PropertyIndex] = hass.data.setdefault(
+        DATA_PROPERTY_INDEXES, {})
+    if (export_url, days_table) not in indexes:
+        indexes[(export_url, days_table)] = PropertyIndex(hass, export_url, days_table)
+    return indexes[(export_url, days_table)]
+
+
+class PropertyIndex:
+    """The whole collection days dataset, in an SQLite file under .storage.
+
+    The dataset is downloaded from the export endpoint on a slow cadence and
+    streamed into a fresh file, which then atomically replaces the old one,
+    so lookups never need the network and never see a half-built index.
+    """
+
+    _hass: HomeAssistant
+    _export_url: str
+    _days_table: str
+    _path: str
+    _built_at: float | None
+    _rebuild_failures: int
+    _next_rebuild_at: float
+    _lock: asyncio.Lock
+
+    def __init__(self, hass: HomeAssistant, export_url: str, days_table: str) -> None:
+        """Initialize the index; nothing is read until it's first used."""
+        self._hass = hass
+        self._export_url = export_url
+        self._days_table = days_table
+        # The same dataset exported from elsewhere is another index.
+        url_hash = hashlib.sha256(export_url.encode()).hexdigest()[:8]
+        self._path = hass.config.path(
+            STORAGE_DIR, f"{DOMAIN}.{slugify(days_table)}.{url_hash}.db")
+        self._built_at = None
+        self._rebuild_failures = 0
+        self._next_rebuild_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def async_ensure_built(self, client: BccApiClient) -> None:
+        """Build the index if there isn't one, and refresh it in the background if stale."""
+        async with self._lock:
+            if self._built_at is None:
+                self._built_at = await self._hass.async_add_executor_job(self._read_built_at)
+            if self._built_at is None:
+                await self._async_build(client)
+                return
+
+        now = time()
+        if (now - self._built_at > PROPERTY_INDEX_REFRESH_SECONDS and
+                now >= self._next_rebuild_at and not self._lock.locked()):
+            self._hass.async_create_background_task(
+                self._async_rebuild(client), f"{DOMAIN} rebuild {self._days_table} index")
+
+    async def async_lookup(self, property_number: int) -> DaysRecord | None:
+        """Return the property's record, or None if the dataset has no such property."""
+        try:
+            return await self._hass.async_add_executor_job(self._lookup, property_number)
+        except sqlite3.Error as err:
+            raise BccApiError(f"Error reading the {self._days_table} index: {err!r}") from err
+
+    async def async_is_built(self) -> bool:
+        """Return whether there's an index to search, however old."""
+        async with self._lock:
+            if self._built_at is None:
+                self._built_at = await self._hass.async_add_executor_job(self._read_built_at)
+        return self._built_at is not None
+
+    async def async_search(self, text: str) -> list[tuple[int, str]]:
+        """Return the property numbers and addresses that start with the text."""
+        try:
+            return await self._hass.async_add_executor_job(
+                self._search, normalize_address(text))
+        except sqlite3.Error as err:
+            raise BccApiError(f"Error reading the {self._days_table} index: {err!r}") from err
+
+    async def _async_rebuild(self, client: BccApiClient) -> None:
+        """Rebuild the index, unless that's already been done meanwhile.
+
+        On failure the old index stays in use, and the rebuild is retried
+        with exponential backoff rather than on every lookup.
+        """
+        async with self._lock:
+            if time() - self._built_at <= PROPERTY_INDEX_REFRESH_SECONDS:
+                return
+            try:
+                await self._async_build(client)
+            except BccApiError as err:
+                self._rebuild_failures += 1
+                backoff = min(RETRY_BASE_SECONDS * 2 ** (self._rebuild_failures - 1),
+                              PROPERTY_INDEX_REFRESH_SECONDS)
+                self._next_rebuild_at = time() + backoff
+                _LOGGER.warning(
+                    "Error rebuilding the %s index, retrying in %d seconds: %s",
+                    self._days_table, backoff, err)
+                return
+            self._rebuild_failures = 0
+
+    async def _async_build(self, client: BccApiClient) -> None:
+        """Stream the dataset's export into a new index and swap it in.
+
+        Whatever goes wrong, from malformed rows to SQLite errors, is raised
+        as a BccApiError and the partly built file is removed.
+        """
+        _LOGGER.debug("Building the %s index at %s", self._days_table, self._path)
+        temp_path = f"{self._path}.tmp"
+        try:
+            await self._async_build_file(client, temp_path)
+        except BaseException as err:
+            await self._hass.async_add_executor_job(self._remove, temp_path)
+            if isinstance(err, (KeyError, ValueError, TypeError, sqlite3.Error, OSError)):
+                raise BccApiError(
+                    f"Error building the {self._days_table} index: {err!r}") from err
+            raise
+
+    async def _async_build_file(self, client: BccApiClient, temp_path: str) -> None:
+        """Build the index into the temporary file, then move it into place."""
+        connection = await self._hass.async_add_executor_job(self._create, temp_path)
+
+        try:
+            rows: list[tuple] = []
+            count = 0
+            async for result in client.async_stream_export(self._export_url, self._days_table):
+                rows.append((
+                    int(result['property_id']), result['suburb'], result['street_name'],
+                    result['house_number'], result['collection_day'], result['zone'],
+                ))
+                if len(rows) >= PROPERTY_INDEX_INSERT_BATCH_SIZE:
+                    count += len(rows)
+                    await self._hass.async_add_executor_job(self._insert, connection, rows)
+                    rows = []
+            count += len(rows)
+            built_at = time()
+            await self._hass.async_add_executor_job(self._finish, connection, rows, built_at)
+        finally:
+            await self._hass.async_add_executor_job(connection.close)
+
+        await self._hass.async_add_executor_job(os.replace, temp_path, self._path)
+        self._built_at = built_at
+        _LOGGER.debug("Built the %s index of %d properties", self._days_table, count)
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        """Remove a partly built index file, if there is one."""
+        if os.path.exists(path):
+            os.remove(path)
+
+    @staticmethod
+    def _create(path: str) -> sqlite3.Connection:
+        """Create an empty index file, replacing any left by an interrupted build."""
+        if os.path.exists(path):
+            os.remove(path)
+        connection = sqlite3.connect(path, check_same_thread=False)
+        for statement in _SCHEMA:
+            connection.execute(statement)
+        return connection
+
+    @staticmethod
+    def _insert(connection: sqlite3.Connection, rows: list[tuple]) -> None:
+        """Add a batch of rows to the index being built."""
+        connection.executemany('INSERT OR REPLACE INTO property VALUES (?, ?, ?, ?, ?, ?)', rows)
+        connection.executemany(
+            'INSERT OR IGNORE INTO address VALUES (?, ?)',
+            ((key, row[0]) for row in rows for key in _address_keys(row)))
+
+    @staticmethod
+    def _finish(connection: sqlite3.Connection, rows: list[tuple], built_at: float) -> None:
+        """Add the last rows, record when the index was built and commit it all."""
+        PropertyIndex._insert(connection, rows)
+        connection.execute("INSERT INTO meta VALUES ('built_at', ?)", (built_at,))
+        connection.execute("INSERT INTO meta VALUES ('schema_version', ?)", (_SCHEMA_VERSION,))
+        connection.commit()
+
+    def _read_built_at(self) -> float | None:
+        """Return when the index on disk was built, or None if there isn't one."""
+        if not os.path.exists(self._path):
+            return None
+        try:
+            with closing(sqlite3.connect(self._path)) as connection:
+                meta = dict(connection.execute('SELECT key, value FROM meta'))
+        except sqlite3.Error as err:
+            # It'll be rebuilt, replacing it.
+            _LOGGER.warning("Ignoring the unreadable index %s: %r", self._path, err)
+            return None
+        return meta.get('built_at') if meta.get('schema_version') == _SCHEMA_VERSION else None
+
+    def _lookup(self, property_number: int) -> DaysRecord | None:
+        """Look the property up by its primary key."""
+        with closing(sqlite3.connect(self._path)) as connection:
+            row = connection.execute(
+                'SELECT suburb, street_name, house_number, collection_day, zone'
+                ' FROM property WHERE property_id = ?',
+                (property_number,)).fetchone()
+        return None if row is None else DaysRecord.interned(*row)
+
+    def _search(self, prefix: str) -> list[tuple[int, str]]:
+        """Find the properties with an address key starting with the prefix."""
+        if not prefix:
+            return []
+        # Everything >= the prefix and < the prefix with its last character
+        # incremented, which the address table's primary key makes a range scan.
+        upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        with closing(sqlite3.connect(self._path)) as connection:
+            rows = connection.execute(
+                'SELECT DISTINCT p.property_id, p.house_number, p.street_name, p.suburb'
+                ' FROM address a JOIN property p ON p.property_id = a.property_id'
+                ' WHERE a.key >= ? AND a.key < ? ORDER BY a.key LIMIT ?',
+                (prefix, upper, ADDRESS_SEARCH_LIMIT)).fetchall()
+        return [
+            (property_id, f"{house_number} {street_name}, {suburb}")
+            for property_id, house_number, street_name, suburb in rows
+        ]
@@ -0,0 +1,56 @@
+"""A rate limit on the requests made to the BCC API by all config entries."""
+
+from __future__ import annotations
+
+import asyncio
+
+from time import monotonic
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_RATE_LIMITER, API_RATE_LIMIT_PER_SECOND, API_RATE_LIMIT_BURST
+
+
+@callback
+def get_rate_limiter(hass: HomeAssistant) -> TokenBucket:
+    """Return the rate limiter shared by every config entry."""
+    if DATA_RATE_LIMITER not in hass.data:
+        hass.data[DATA_RATE_LIMITER] = TokenBucket(
+            API_RATE_LIMIT_PER_SECOND, API_RATE_LIMIT_BURST)
+    return hass.data[DATA_RATE_LIMITER]
+
+
+class TokenBucket:
+    """Allows bursts of up to 'capacity' requests, refilling at 'rate' per second.
+
+    Waiters are served in the order they arrive.
+    """
+
+    _rate: float
+    _capacity: float
+    _tokens: float
+    _updated: float
+    _lock: asyncio.Lock
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """Initialize a full bucket."""
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated = monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last refill."""
+        now = monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    async def async_acquire(self) -> None:
+        """Wait until a request may be made."""
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+                self._refill()
+            self._tokens -= 1
@@ -0,0 +1,135 @@
+"""An HTTP response cache for the BCC API, kept across restarts."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+
+from dataclasses import dataclass
+from time import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DOMAIN,
+    DATA_RESPONSE_CACHE,
+    RESPONSE_CACHE_MAX_ENTRIES,
+    STORAGE_SAVE_DELAY_SECONDS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+_MAX_AGE = re.compile(r'max-age=(\d+)')
+
+RESPONSE_CACHE_STORAGE_VERSION = 1
+
+
+@callback
+def get_response_cache(hass: HomeAssistant) -> ResponseCache:
+    """Return the response cache shared by every config entry."""
+    if DATA_RESPONSE_CACHE not in hass.data:
+        hass.data[DATA_RESPONSE_CACHE] = ResponseCache(hass)
+    return hass.data[DATA_RESPONSE_CACHE]
+
+
+@dataclass(slots=True)
+class CachedResponse:
+    """A decoded response and what's needed to revalidate it."""
+
+    body: Any
+    etag: str | None
+    last_modified: str | None
+    expires_at: float
+
+    def is_fresh(self) -> bool:
+        """Return whether the response can be used without revalidating it."""
+        return time() < self.expires_at
+
+    def validators(self) -> dict[str, str]:
+        """Return the headers that make a request conditional on this response."""
+        headers = {}
+        if self.etag is not None:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified is not None:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+@dataclass
+class ResponseCacheStats:
+    """Counts how requests were served."""
+
+    hits: int = 0
+    misses: int = 0
+    revalidations: int = 0
+
+
+def expires_at(cache_control: str | None) -> float | None:
+    """Compute when a response expires from its Cache-Control, or None if uncacheable."""
+    if cache_control is None:
+        return time()
+    if 'no-store' in cache_control:
+        return None
+    if 'no-cache' in cache_control or (match := _MAX_AGE.search(cache_control)) is None:
+        return time()
+    return time() + int(match.group(1))
+
+
+class ResponseCache:
+    """Decoded BCC API responses keyed by their full URL.
+
+    Entries are saved in .storage so that revalidation survives restarts,
+    and the oldest entries are dropped beyond RESPONSE_CACHE_MAX_ENTRIES.
+    """
+
+    _entries: dict[str, CachedResponse]
+    _store: Store[dict[str, Any]]
+    _load_lock: asyncio.Lock
+    _loaded: bool
+    stats: ResponseCacheStats
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache; it's loaded from storage on first use."""
+        self._entries = {}
+        self._store = Store(hass, RESPONSE_CACHE_STORAGE_VERSION, f"{DOMAIN}.response_cache")
+        self._load_lock = asyncio.Lock()
+        self._loaded = False
+        self.stats = ResponseCacheStats()
+
+    async def async_get(self, url: str) -> CachedResponse | None:
+        """Return the cached response for the URL, fresh or not."""
+        if not self._loaded:
+            async with self._load_lock:
+                if not self._loaded:
+                    stored = await self._store.async_load() or {}
+                    # Keep anything cached since startup over what was saved.
+                    self._entries = {
+                        url: CachedResponse(**entry) for url, entry in stored.items()
+                    } | self._entries
+                    self._loaded = True
+        return self._entries.get(url)
+
+    @callback
+    def async_put(self, url: str, response: CachedResponse) -> None:
+        """Cache the response for the URL and schedule saving the cache."""
+        self._entries.pop(url, None)
+        self._entries[url] = response
+        while len(self._entries) > RESPONSE_CACHE_MAX_ENTRIES:
+            del self._entries[next(iter(self._entries))]
+        self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY_SECONDS)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the entries in a form that can be saved as JSON."""
+        return {
+            url: {
+                'body': entry.body,
+                'etag': entry.etag,
+                'last_modified': entry.last_modified,
+                'expires_at': entry.expires_at,
+            }
+            for url, entry in self._entries.items()
+        }
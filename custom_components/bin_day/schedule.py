@@ -0,0 +1,158 @@
+"""The recycling week schedule of a collection zone."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import date, timedelta
+from enum import StrEnum
+from time import time
+from typing import TYPE_CHECKING, Any
+
+from .const import ZONE_SCHEDULE_TTL_SECONDS
+
+if TYPE_CHECKING:
+    from .data import BccApiData
+
+
+@dataclass(frozen=True, slots=True)
+class ZoneSchedule:
+    """The weeks a zone has its recycling collected, sorted by week start."""
+
+    zone: str
+    # The first week the schedule was fetched from.
+    starts: date
+    recycling_weeks: tuple[date, ...]
+    fetched_at: float
+
+    @classmethod
+    def from_results(
+            cls,
+            zone: str,
+            starts: date,
+            results: list[dict[str, Any]]
+    ) -> ZoneSchedule:
+        """Build the schedule from the weeks dataset records of the zone from 'starts' on."""
+        return cls(
+            zone=zone,
+            starts=starts,
+            recycling_weeks=tuple(sorted({
+                date.fromisoformat(str(result['week_starting'])[:10]) for result in results
+            })),
+            fetched_at=time(),
+        )
+
+    @classmethod
+    def from_dict(cls, stored: dict[str, Any]) -> ZoneSchedule:
+        """Restore a schedule saved with as_dict."""
+        return cls(
+            zone=stored['zone'],
+            starts=date.fromisoformat(stored['starts']),
+            recycling_weeks=tuple(date.fromisoformat(week) for week in stored['recycling_weeks']),
+            fetched_at=stored['fetched_at'],
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the schedule in a form that can be saved as JSON."""
+        return {
+            'zone': self.zone,
+            'starts': self.starts.isoformat(),
+            'recycling_weeks': [week.isoformat() for week in self.recycling_weeks],
+            'fetched_at': self.fetched_at,
+        }
+
+    def is_expired(self) -> bool:
+        """Return whether the schedule is old enough that it should be refetched."""
+        return time() - self.fetched_at > ZONE_SCHEDULE_TTL_SECONDS
+
+    def covers(self, week_start: date) -> bool:
+        """Return whether the schedule knows about the given week."""
+        return (len(self.recycling_weeks) > 0 and
+                self.starts <= week_start <=
+                self.recycling_weeks[-1] + timedelta(days=7))
+
+    def is_recycling_week(self, week_start: date) -> bool:
+        """Return whether the recycling is collected in the given week."""
+        index = bisect_left(self.recycling_weeks, week_start)
+        return (index < len(self.recycling_weeks) and
+                self.recycling_weeks[index] == week_start)
+
+
+class CollectionType(StrEnum):
+    """The bins collected."""
+
+    GENERAL = 'general'
+    RECYCLING = 'recycling'
+    GREEN_WASTE = 'green_waste'
+
+
+@dataclass(frozen=True, slots=True)
+class Collection:
+    """The collection of one type of bin on one day."""
+
+    day: date
+    type: CollectionType
+
+
+class CollectionIndex:
+    """The upcoming collections of a property, sorted by day for range queries."""
+
+    collections: tuple[Collection, ...]
+    _days: tuple[date, ...]
+
+    def __init__(self, collections: list[Collection]) -> None:
+        """Index the collections, which must already be sorted by day."""
+        self.collections = tuple(collections)
+        self._days = tuple(collection.day for collection in collections)
+
+    @classmethod
+    def build(
+            cls,
+            data: BccApiData,
+            schedule: ZoneSchedule | None,
+            today: date,
+            horizon_days: int
+    ) -> CollectionIndex:
+        """Compute the collections from the most recent collection day to the horizon.
+
+        Whether the recycling or green waste bin goes out with the general
+        waste comes from the zone's schedule for the weeks it covers, and
+        from the fetched recycling flag for the week of the next collection.
+        """
+        if data.collection_day_no is None:
+            return cls([])
+
+        if schedule is not None and schedule.zone != str(data.collection_zone):
+            schedule = None
+        next_week_start = data.collection_week_start()
+
+        collections = []
+        day = today - timedelta(days=(today.weekday() - data.collection_day_no) % 7)
+        while day <= today + timedelta(days=horizon_days):
+            collections.append(Collection(day, CollectionType.GENERAL))
+
+            week_start = day - timedelta(days=data.collection_day_no)
+            recycling_week = None
+            if schedule is not None and schedule.covers(week_start):
+                recycling_week = schedule.is_recycling_week(week_start)
+            elif week_start == next_week_start:
+                recycling_week = data.recycling_week
+
+            if recycling_week:
+                collections.append(Collection(day, CollectionType.RECYCLING))
+            elif recycling_week is not None and data.has_green_bin:
+                collections.append(Collection(day, CollectionType.GREEN_WASTE))
+
+            day += timedelta(days=7)
+
+        return cls(collections)
+
+    def between(self, first_day: date, last_day: date) -> tuple[Collection, ...]:
+        """Return the collections from the first day to the last day, inclusive."""
+        return self.collections[
+            bisect_left(self._days, first_day):bisect_right(self._days, last_day)]
+
+    def next(self, today: date) -> Collection | None:
+        """Return the first collection today or after."""
+        index = bisect_left(self._days, today)
+        return self.collections[index] if index < len(self.collections) else None
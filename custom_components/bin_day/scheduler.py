@@ -0,0 +1,130 @@
+"""Wakes entities only when their time-dependent values actually change."""
+
+from __future__ import annotations
+
+import logging
+
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from enum import StrEnum
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_time
+
+if TYPE_CHECKING:
+    from .coordinator import BccApiDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Fire just after a transition so the values computed then are the new ones.
+_TRANSITION_DELAY = timedelta(seconds=1)
+
+
+class Transition(StrEnum):
+    """The points in time at which derived values change."""
+
+    HOURLY = 'hourly'
+    """The top of every hour, when due_in_hours ticks down."""
+    ALERT = 'alert'
+    """The start of the alert window before collection day."""
+    COLLECTION = 'collection'
+    """Midnight at the start of collection day."""
+
+
+class BinDayScheduler:
+    """Schedules one timer per coordinator for the next transition of its data.
+
+    Listeners register for the transitions that affect their value and are
+    only called back when one of those happens.  The timer is only running
+    while there are listeners, so it goes away with the entities on unload.
+    """
+
+    _hass: HomeAssistant
+    _coordinator: BccApiDataUpdateCoordinator
+    _listeners: dict[CALLBACK_TYPE, frozenset[Transition]]
+    _unsub_coordinator: CALLBACK_TYPE | None
+    _unsub_timer: CALLBACK_TYPE | None
+
+    def __init__(self, hass: HomeAssistant, coordinator: BccApiDataUpdateCoordinator) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._coordinator = coordinator
+        self._listeners = {}
+        self._unsub_coordinator = None
+        self._unsub_timer = None
+
+    @callback
+    def async_add_listener(
+            self,
+            transitions: frozenset[Transition],
+            update_callback: CALLBACK_TYPE
+    ) -> Callable[[], None]:
+        """Call update_callback at the given transitions; returns a callback to stop."""
+        self._listeners[update_callback] = transitions
+        if self._unsub_coordinator is None:
+            self._unsub_coordinator = self._coordinator.async_add_listener(self._async_schedule)
+            self._async_schedule()
+
+        @callback
+        def _remove_listener() -> None:
+            self._listeners.pop(update_callback, None)
+            if not self._listeners:
+                self._async_cancel()
+
+        return _remove_listener
+
+    @callback
+    def _async_cancel(self) -> None:
+        """Stop the timer and stop following the coordinator."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+        if self._unsub_coordinator is not None:
+            self._unsub_coordinator()
+            self._unsub_coordinator = None
+
+    def _next_transitions(self, now: datetime) -> tuple[datetime, set[Transition]] | None:
+        """Compute when the next transitions are due, in naive local time."""
+        data = self._coordinator.data
+        next_collection_date = None if data is None else data.next_collection_date()
+        if next_collection_date is None:
+            return None
+
+        candidates = {
+            Transition.HOURLY: (now.replace(minute=0, second=0, microsecond=0) +
+                                timedelta(hours=1)),
+            Transition.COLLECTION: next_collection_date,
+        }
+        alert_start = next_collection_date - timedelta(hours=data.alert_hours)
+        if alert_start > now:
+            candidates[Transition.ALERT] = alert_start
+
+        when = min(candidates.values())
+        return when, {transition for transition, at in candidates.items() if at == when}
+
+    @callback
+    def _async_schedule(self) -> None:
+        """(Re)schedule the timer for the next transitions of the current data."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+        next_transitions = self._next_transitions(datetime.now())
+        if next_transitions is None:
+            return
+
+        when, transitions = next_transitions
+
+        @callback
+        def _async_fire(_now: datetime) -> None:
+            self._unsub_timer = None
+            _LOGGER.debug("Firing transitions %s", sorted(transitions))
+            for update_callback, wanted in list(self._listeners.items()):
+                if not wanted.isdisjoint(transitions):
+                    update_callback()
+            self._async_schedule()
+
+        # The data's times are naive local times; astimezone() makes them aware.
+        self._unsub_timer = async_track_point_in_time(
+            self._hass, _async_fire, (when + _TRANSITION_DELAY).astimezone())
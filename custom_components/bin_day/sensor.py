@@ -6,28 +6,32 @@ import logging
 
 from collections.abc import Callable
 from dataclasses import dataclass
-from datetime import datetime
 from typing import Any
 
 from homeassistant.components.sensor import (
     DOMAIN as SENSOR_DOMAIN,
 )
 from homeassistant.components.sensor import (
+    SensorDeviceClass,
     SensorEntity,
     SensorEntityDescription,
+    SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_track_utc_time_change
 from homeassistant.helpers.typing import StateType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, CONF_SERVICE_NAME
+from .const import DOMAIN, CONF_SERVICE_NAME, CONF_COMPACT_MODE
 from .data import BccApiData
+from .metrics import RefreshMetrics
 from .coordinator import BccApiDataUpdateCoordinator
+from .profiler import profiled
+from .scheduler import Transition
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -36,6 +40,10 @@ _LOGGER = logging.getLogger(__name__)
 class BinDaySensorEntityDescription(SensorEntityDescription):
     """Describes a Solar Forecast Sensor."""
     value: Callable[[BccApiData], Any] | None = None
+    # For the sensors about the refreshes rather than the data, used instead of value.
+    metrics_value: Callable[[RefreshMetrics], Any] | None = None
+    # The points in time, besides coordinator updates, at which the value changes.
+    transitions: frozenset[Transition] = frozenset()
 
 
 # pylint: disable=unexpected-keyword-arg
@@ -97,35 +105,73 @@ SENSORS: tuple[BinDaySensorEntityDescription, ...] = (
     BinDaySensorEntityDescription(
         key="next_collection_date",
         translation_key="next_collection_date",
-        value=lambda data: data.next_collection_date(),
+        value=lambda data: data.snapshot().next_collection_date,
+        transitions=frozenset({Transition.COLLECTION}),
     ),
     BinDaySensorEntityDescription(
         key="is_bin_time",
         translation_key="is_bin_time",
-        value=lambda data: data.is_bin_time(),
+        value=lambda data: data.snapshot().is_bin_time,
+        transitions=frozenset({Transition.ALERT, Transition.COLLECTION}),
     ),
     BinDaySensorEntityDescription(
         key="due_in_hours",
         translation_key="due_in_hours",
-        value=lambda data: data.due_in_hours(),
+        value=lambda data: data.snapshot().due_in_hours,
+        transitions=frozenset({Transition.HOURLY, Transition.COLLECTION}),
     ),
     BinDaySensorEntityDescription(
         key="extra_bin_text",
         translation_key="extra_bin_test",
-        value=lambda data: data.extra_bin_text(),
+        value=lambda data: data.snapshot().extra_bin_text,
     ),
     BinDaySensorEntityDescription(
         key="is_recycling_week",
         translation_key="is_recycling_week",
-        value=lambda data: data.is_recycling_week(),
+        value=lambda data: data.snapshot().is_recycling_week,
     ),
     BinDaySensorEntityDescription(
         key="is_green_waste_week",
         translation_key="is_green_waste_week",
-        value=lambda data: data.is_green_waste_week(),
+        value=lambda data: data.snapshot().is_green_waste_week,
+    ),
+    BinDaySensorEntityDescription(
+        key="last_refresh_duration",
+        translation_key="last_refresh_duration",
+        metrics_value=lambda metrics: metrics.last_refresh_seconds(),
+        entity_category=EntityCategory.DIAGNOSTIC,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_display_precision=3,
+    ),
+    BinDaySensorEntityDescription(
+        key="api_latency_p95",
+        translation_key="api_latency_p95",
+        metrics_value=lambda metrics: metrics.api_latency(0.95),
+        entity_category=EntityCategory.DIAGNOSTIC,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_display_precision=3,
+    ),
+    BinDaySensorEntityDescription(
+        key="api_failures",
+        translation_key="api_failures",
+        metrics_value=lambda metrics: metrics.fetch_failures(),
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.MEASUREMENT,
     ),
 )
 
+# The one sensor of compact mode, with the other derived values as attributes.
+COMPACT_SENSOR = BinDaySensorEntityDescription(
+    key="collection",
+    translation_key="collection",
+    value=lambda data: data.snapshot().next_collection_date,
+    transitions=frozenset({Transition.HOURLY, Transition.ALERT, Transition.COLLECTION}),
+)
+
 
 async def async_setup_entry(
         hass: HomeAssistant,
@@ -135,15 +181,36 @@ async def async_setup_entry(
     """Defer sensor setup to the shared sensor module."""
     coordinator: BccApiDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    async_add_entities(
-        BinDaySensorEntity(
-            entry_id=entry.entry_id,
-            service_name=entry.options[CONF_SERVICE_NAME],
-            coordinator=coordinator,
-            entity_description=entity_description,
-        )
-        for entity_description in SENSORS
-    )
+    if entry.options.get(CONF_COMPACT_MODE):
+        entities = [
+            BinDayCompactSensorEntity(
+                entry_id=entry.entry_id,
+                service_name=entry.options[CONF_SERVICE_NAME],
+                coordinator=coordinator,
+                entity_description=COMPACT_SENSOR,
+            )
+        ]
+    else:
+        entities = [
+            BinDaySensorEntity(
+                entry_id=entry.entry_id,
+                service_name=entry.options[CONF_SERVICE_NAME],
+                coordinator=coordinator,
+                entity_description=entity_description,
+            )
+            for entity_description in SENSORS
+        ]
+
+    # Switching compact mode on or off leaves the other mode's sensors behind.
+    unique_ids = {entity.unique_id for entity in entities}
+    entity_registry = er.async_get(hass)
+    for registry_entry in er.async_entries_for_config_entry(entity_registry, entry.entry_id):
+        if (registry_entry.domain == SENSOR_DOMAIN and
+                registry_entry.unique_id not in unique_ids):
+            _LOGGER.debug("Removing sensor %s", registry_entry.entity_id)
+            entity_registry.async_remove(registry_entry.entity_id)
+
+    async_add_entities(entities)
 
 
 class BinDaySensorEntity(CoordinatorEntity[BccApiDataUpdateCoordinator], SensorEntity):
@@ -151,6 +218,7 @@ class BinDaySensorEntity(CoordinatorEntity[BccApiDataUpdateCoordinator], SensorE
 
     entity_description: BinDaySensorEntityDescription
     _attr_has_entity_name = True
+    _last_published: tuple[bool, StateType] | None = None
 
     def __init__(
         self,
@@ -166,31 +234,119 @@ class BinDaySensorEntity(CoordinatorEntity[BccApiDataUpdateCoordinator], SensorE
         self.entity_id = f"{SENSOR_DOMAIN}.{DOMAIN}_{entity_description.key}"
         self._attr_unique_id = f"{entry_id}_{entity_description.key}"
 
-        self._attr_device_info = DeviceInfo(
-            entry_type=DeviceEntryType.SERVICE,
-            identifiers={(DOMAIN, entry_id)},
-            name=service_name,
-        )
+        self._attr_device_info = coordinator.device_info
 
         _LOGGER.debug("Added sensor %s to service %s", self.entity_id, service_name)
 
-    async def _update_callback(self, _now: datetime) -> None:
-        """Update the entity without fetching data from server."""
+    def _published_state(self) -> tuple[bool, StateType]:
+        """Return what a state write would publish, for change detection."""
+        return self.available, self.native_value if self.available else None
+
+    @callback
+    def _async_write_if_changed(self) -> None:
+        """Write the state only if it differs from the last one written."""
+        published_state = self._published_state()
+        if published_state == self._last_published:
+            self.coordinator.write_stats.suppressed += 1
+            return
+        self._last_published = published_state
+        self.coordinator.write_stats.emitted += 1
         self.async_write_ha_state()
 
+    @callback
+    @profiled('sensor_update')
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._async_write_if_changed()
+
+    @callback
+    @profiled('sensor_tick')
+    def _update_callback(self) -> None:
+        """Update the entity without fetching data from server."""
+        self._async_write_if_changed()
+
     async def async_added_to_hass(self) -> None:
         """Register callbacks."""
         await super().async_added_to_hass()
 
-        # Update the value of the sensor every minute without
+        # The platform writes the initial state once we return.
+        self._last_published = self._published_state()
+
+        # Update the value of the sensor when it changes with time, without
         # fetching new data from the server.
-        async_track_utc_time_change(
-            self.hass,
-            self._update_callback,
-            second=0,
-        )
+        if self.entity_description.transitions:
+            self.async_on_remove(
+                self.coordinator.scheduler.async_add_listener(
+                    self.entity_description.transitions, self._update_callback))
 
     @property
     def native_value(self) -> StateType:
         """Return the value of the sensor."""
-        return self.entity_description.value(self.coordinator.data)
+        if self.entity_description.metrics_value is not None:
+            return self.entity_description.metrics_value(self.coordinator.metrics)
+        # Unknown until the first refresh of an entry with nothing restored.
+        if (data := self.coordinator.data) is None:
+            return None
+        return self.entity_description.value(data)
+
+
+class BinDayCompactSensorEntity(BinDaySensorEntity):
+    """Defines the single sensor of compact mode.
+
+    The derived values are attributes of the next collection date, and the
+    address and property number are on the device, rather than each being
+    an entity of its own.
+    """
+
+    _device_model: str | None = None
+
+    def _published_state(self) -> tuple:
+        """Return what a state write would publish, including the attributes."""
+        attributes = self.extra_state_attributes if self.available else None
+        return (*super()._published_state(),
+                None if attributes is None else tuple(attributes.values()))
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the values derived from the data besides the next collection date."""
+        if (data := self.coordinator.data) is None:
+            return None
+        snapshot = data.snapshot()
+        return {
+            'due_in_hours': snapshot.due_in_hours,
+            'is_bin_time': snapshot.is_bin_time,
+            'bin_type': snapshot.extra_bin_text,
+            'is_recycling_week': snapshot.is_recycling_week,
+            'is_green_waste_week': snapshot.is_green_waste_week,
+            'collection_day': data.collection_day,
+            'collection_zone': data.collection_zone,
+        }
+
+    @callback
+    def _async_update_device(self) -> None:
+        """Put the address on the device, once it's known or if it changes."""
+        data = self.coordinator.data
+        if data is None or data.collection_day is None or self.registry_entry is None:
+            return
+
+        model = f"{data.house_number} {data.street_name}, {data.suburb}"
+        if model == self._device_model:
+            return
+        self._device_model = model
+        dr.async_get(self.hass).async_update_device(
+            self.registry_entry.device_id,
+            manufacturer="Brisbane City Council",
+            model=model,
+            serial_number=str(data.property_number),
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._async_update_device()
+        super()._handle_coordinator_update()
+
+    async def async_added_to_hass(self) -> None:
+        """Register callbacks and describe the device."""
+        await super().async_added_to_hass()
+        self._async_update_device()
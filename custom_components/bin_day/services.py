@@ -0,0 +1,260 @@
+"""Services for Brisbane Bin Day."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from datetime import date, timedelta
+
+import voluptuous as vol
+
+from homeassistant.const import ATTR_CONFIG_ENTRY_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .api import BccApiClient, BccApiError
+from .batch import get_batch_fetcher
+from .const import (
+    DOMAIN,
+    CONF_BASE_URL,
+    CONF_DAYS_TABLE,
+    CONF_WEEKS_TABLE,
+    DEFAULT_BASE_URL,
+    DEFAULT_DAYS_TABLE,
+    DEFAULT_WEEKS_TABLE,
+    SERVICE_GET_SCHEDULE,
+    SERVICE_GET_DUE_TIMES,
+    SERVICE_PROFILE,
+    ATTR_PROPERTY_NUMBERS,
+    ATTR_COUNT,
+    ATTR_HAS_GREEN_BIN,
+    ATTR_BIN_TIME_ONLY,
+    ATTR_DURATION,
+    DEFAULT_SCHEDULE_COUNT,
+    MAXIMUM_SCHEDULE_COUNT,
+    DEFAULT_PROFILE_SECONDS,
+    MAXIMUM_PROFILE_SECONDS,
+)
+from .data import BccApiData, DaysRecord
+from .fleet import FleetSchedule
+from .profiler import get_profiler
+from .ratelimit import get_rate_limiter
+from .response_cache import get_response_cache
+from .schedule import CollectionIndex, ZoneSchedule
+from .zones import get_zone_schedules
+
+_LOGGER = logging.getLogger(__name__)
+
+GET_SCHEDULE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_PROPERTY_NUMBERS): vol.All(
+            cv.ensure_list, vol.Length(min=1), [cv.positive_int]),
+        vol.Optional(ATTR_COUNT, default=DEFAULT_SCHEDULE_COUNT): vol.All(
+            cv.positive_int, vol.Range(max=MAXIMUM_SCHEDULE_COUNT)),
+        vol.Optional(ATTR_HAS_GREEN_BIN, default=False): cv.boolean,
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+    }
+)
+
+GET_DUE_TIMES_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_BIN_TIME_ONLY, default=False): cv.boolean,
+    }
+)
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DURATION, default=DEFAULT_PROFILE_SECONDS): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=MAXIMUM_PROFILE_SECONDS)),
+    }
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the services of the integration."""
+
+    async def _async_get_schedule(call: ServiceCall) -> ServiceResponse:
+        """Return the next collections of any properties, configured or not."""
+        property_numbers = list(dict.fromkeys(call.data[ATTR_PROPERTY_NUMBERS]))
+        count = call.data[ATTR_COUNT]
+        base_url, days_table, weeks_table = _dataset_options(
+            hass, call.data.get(ATTR_CONFIG_ENTRY_ID))
+        client = BccApiClient(
+            async_get_clientsession(hass),
+            base_url,
+            get_response_cache(hass),
+            rate_limiter=get_rate_limiter(hass))
+
+        try:
+            schedules = await _async_get_schedules(
+                hass, client, days_table, weeks_table, property_numbers)
+        except BccApiError as err:
+            raise HomeAssistantError(f"Error requesting the schedules: {err}") from err
+
+        today = date.today()
+        return {
+            str(property_number): _schedule_response(
+                property_number, record, schedule,
+                call.data[ATTR_HAS_GREEN_BIN], today, count)
+            for property_number, (record, schedule) in schedules.items()
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_SCHEDULE,
+        _async_get_schedule,
+        schema=GET_SCHEDULE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    async def _async_get_due_times(call: ServiceCall) -> ServiceResponse:
+        """Return when the bins of every configured property are next due."""
+        fleet = FleetSchedule(
+            coordinator.data for coordinator in hass.data.get(DOMAIN, {}).values()
+            if coordinator.data is not None)
+        due_times = fleet.due_times()
+
+        return {
+            str(property_number): {
+                'next_collection_date': (
+                    None if next_collection_date is None else next_collection_date.isoformat()),
+                'due_in_hours': due_in_hours,
+                'is_bin_time': is_bin_time,
+            }
+            for property_number, next_collection_date, due_in_hours, is_bin_time
+            in zip(*due_times, strict=True)
+            if is_bin_time or not call.data[ATTR_BIN_TIME_ONLY]
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_DUE_TIMES,
+        _async_get_due_times,
+        schema=GET_DUE_TIMES_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    async def _async_profile(call: ServiceCall) -> None:
+        """Profile the refreshes and sensor updates for a while."""
+        get_profiler(hass).async_start(call.data[ATTR_DURATION])
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        _async_profile,
+        schema=PROFILE_SCHEMA,
+    )
+
+
+@callback
+def _dataset_options(hass: HomeAssistant, config_entry_id: str | None) -> tuple[str, str, str]:
+    """Return the API URL, days table and weeks table to look properties up with.
+
+    They're those of the given config entry, else of the first configured
+    one, so that the cached data of the configured entries is shared, else
+    the defaults.
+    """
+    if config_entry_id is not None:
+        entry = hass.config_entries.async_get_entry(config_entry_id)
+        if entry is None or entry.domain != DOMAIN:
+            raise HomeAssistantError(f"No {DOMAIN} config entry {config_entry_id}")
+        entries = [entry]
+    else:
+        entries = hass.config_entries.async_entries(DOMAIN)
+    if not entries:
+        return DEFAULT_BASE_URL, DEFAULT_DAYS_TABLE, DEFAULT_WEEKS_TABLE
+
+    options = entries[0].options
+    return (
+        options.get(CONF_BASE_URL, DEFAULT_BASE_URL),
+        options.get(CONF_DAYS_TABLE, DEFAULT_DAYS_TABLE),
+        options.get(CONF_WEEKS_TABLE, DEFAULT_WEEKS_TABLE),
+    )
+
+
+async def _async_get_schedules(
+        hass: HomeAssistant,
+        client: BccApiClient,
+        days_table: str,
+        weeks_table: str,
+        property_numbers: list[int]
+) -> dict[int, tuple[DaysRecord | None, ZoneSchedule | None]]:
+    """Fetch the days records in batches, then the schedule of each distinct zone once."""
+    records = await get_batch_fetcher(hass).async_get_days_records(
+        client, days_table, property_numbers)
+
+    # Every zone's schedule from the earliest next collection week of its
+    # properties covers the rest of them too.
+    week_starts: dict[str, date] = {}
+    for record in records.values():
+        if record is not None and (
+                week_start := _api_data(0, record, False).collection_week_start()):
+            zone = str(record.collection_zone)
+            week_starts[zone] = min(week_start, week_starts.get(zone, week_start))
+
+    zones = list(week_starts)
+    zone_schedules = get_zone_schedules(hass)
+    schedules = dict(zip(zones, await asyncio.gather(*(
+        zone_schedules.async_get(client, weeks_table, zone, week_starts[zone])
+        for zone in zones
+    ))))
+    _LOGGER.debug(
+        "Fetched the schedules of %d properties in %d zones", len(property_numbers), len(zones))
+
+    return {
+        property_number: (
+            record, None if record is None else schedules.get(str(record.collection_zone)))
+        for property_number, record in records.items()
+    }
+
+
+def _api_data(property_number: int, record: DaysRecord, has_green_bin: bool) -> BccApiData:
+    """Return the data of a property that has no config entry."""
+    api_data = BccApiData(property_number, 0, 0, has_green_bin)
+    api_data.apply_days_record(record)
+    return api_data
+
+
+def _schedule_response(
+        property_number: int,
+        record: DaysRecord | None,
+        schedule: ZoneSchedule | None,
+        has_green_bin: bool,
+        today: date,
+        count: int
+) -> dict:
+    """Return the next 'count' collection days of the property."""
+    if record is None:
+        return {'found': False}
+
+    api_data = _api_data(property_number, record, has_green_bin)
+    index = CollectionIndex.build(api_data, schedule, today, count * 7)
+
+    # From tomorrow, as for the next collection date: on collection day the
+    # zone's schedule is fetched from next week, so today's week isn't covered.
+    collections: dict[date, list[str]] = {}
+    for collection in index.between(today + timedelta(days=1), date.max):
+        collections.setdefault(collection.day, []).append(collection.type)
+
+    return {
+        'found': True,
+        'suburb': record.suburb,
+        'street_name': record.street_name,
+        'house_number': record.house_number,
+        'collection_day': record.collection_day,
+        'collection_zone': record.collection_zone,
+        'collections': [
+            {'date': day.isoformat(), 'bins': bins}
+            for day, bins in list(collections.items())[:count]
+        ],
+    }
@@ -0,0 +1,101 @@
+"""Persistence of the last good BCC API data in Home Assistant's .storage."""
+
+from __future__ import annotations
+
+import logging
+
+from datetime import date
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, STORAGE_VERSION, STORAGE_MINOR_VERSION, STORAGE_SAVE_DELAY_SECONDS
+from .data import DaysRecord
+from .schedule import ZoneSchedule
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def create_store(hass: HomeAssistant, entry_id: str) -> BinDayStore:
+    """Create the store holding the given config entry's snapshot."""
+    return BinDayStore(
+        hass,
+        STORAGE_VERSION,
+        f"{DOMAIN}.{entry_id}",
+        minor_version=STORAGE_MINOR_VERSION,
+    )
+
+
+class BinDayStore(Store[dict[str, Any]]):
+    """Persists the last good days record and zone schedule of a config entry.
+
+    The stored format is:
+        {
+            'property_number': int,
+            'days_record': {<DaysRecord fields>} | None,
+            'zone_schedule': {<ZoneSchedule.as_dict()>} | None,
+        }
+    """
+
+    async def _async_migrate_func(
+            self,
+            old_major_version: int,
+            old_minor_version: int,
+            old_data: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Migrate the stored data from an older version of the format."""
+        _LOGGER.debug(
+            "Migrating %s from version %d.%d",
+            self.key, old_major_version, old_minor_version)
+
+        if old_major_version > STORAGE_VERSION:
+            raise NotImplementedError
+
+        # 1.2 added the first week a zone schedule was fetched from, which
+        # before then was always its first recycling week.
+        if old_minor_version < 2 and (zone_schedule := old_data.get('zone_schedule')):
+            weeks = zone_schedule['recycling_weeks']
+            zone_schedule['starts'] = weeks[0] if weeks else date.min.isoformat()
+
+        # 1.3 dropped the recycling flag, which can't be trusted without
+        # knowing the week it was for; the zone schedule says instead.
+        if old_minor_version < 3:
+            old_data.pop('recycling_week', None)
+
+        return old_data
+
+    async def async_load_snapshot(
+            self,
+            property_number: int
+    ) -> tuple[DaysRecord | None, ZoneSchedule | None] | None:
+        """Load the saved days record and zone schedule, if any."""
+        stored = await self.async_load()
+        # Ignore what was saved before the property number was reconfigured.
+        if stored is None or stored.get('property_number') != property_number:
+            return None
+
+        days_record = stored.get('days_record')
+        zone_schedule = stored.get('zone_schedule')
+        return (
+            None if days_record is None else DaysRecord.interned(**days_record),
+            None if zone_schedule is None else ZoneSchedule.from_dict(zone_schedule),
+        )
+
+    @callback
+    def async_save_snapshot(
+            self,
+            property_number: int,
+            days_record: DaysRecord | None,
+            zone_schedule: ZoneSchedule | None
+    ) -> None:
+        """Save the snapshot once things have quietened down."""
+        self.async_delay_save(
+            lambda: {
+                'property_number': property_number,
+                'days_record': None if days_record is None else days_record._asdict(),
+                'zone_schedule': None if zone_schedule is None else zone_schedule.as_dict(),
+            },
+            STORAGE_SAVE_DELAY_SECONDS,
+        )
@@ -0,0 +1,137 @@
+"""Zone schedules shared by every config entry."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from collections import OrderedDict
+from datetime import date, timedelta
+
+from homeassistant.core import HomeAssistant, callback
+
+from .api import BccApiClient
+from .const import DATA_ZONE_SCHEDULES, ZONE_SCHEDULES_MAX_ZONES
+from .schedule import ZoneSchedule
+
+_LOGGER = logging.getLogger(__name__)
+
+# A zone is identified by the URL template and weeks dataset it's fetched with, and its name.
+ZoneKey = tuple[str, str, str]
+
+
+@callback
+def get_zone_schedules(hass: HomeAssistant) -> ZoneScheduleCache:
+    """Return the zone schedule cache shared by every config entry."""
+    if DATA_ZONE_SCHEDULES not in hass.data:
+        hass.data[DATA_ZONE_SCHEDULES] = ZoneScheduleCache()
+    return hass.data[DATA_ZONE_SCHEDULES]
+
+
+def _current_week_start() -> date:
+    """Return the Monday of the current week."""
+    today = date.today()
+    return today - timedelta(days=today.weekday())
+
+
+class ZoneScheduleCache:
+    """One schedule per zone, however many entries are in it.
+
+    Concurrent requests for the same zone share a single fetch.  Schedules
+    are refetched once they expire or no longer cover the week asked for,
+    and the least recently used are evicted beyond ZONE_SCHEDULES_MAX_ZONES.
+    """
+
+    _schedules: OrderedDict[ZoneKey, ZoneSchedule]
+    _in_flight: dict[ZoneKey, asyncio.Future[ZoneSchedule]]
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._schedules = OrderedDict()
+        self._in_flight = {}
+
+    @callback
+    def async_seed(
+            self,
+            client: BccApiClient,
+            weeks_table: str,
+            schedule: ZoneSchedule
+    ) -> ZoneSchedule:
+        """Add a schedule restored from storage, unless a newer one is cached; returns the cached one.
+
+        Entries in the same zone restore the same schedule, so all but the
+        first share the cached copy rather than each keeping their own.
+        """
+        key = (client.base_url, weeks_table, schedule.zone)
+        cached = self._schedules.get(key)
+        if cached is None or cached.fetched_at < schedule.fetched_at:
+            self._put(key, schedule)
+            return schedule
+        return cached
+
+    @callback
+    def async_get_cached(
+            self,
+            client: BccApiClient,
+            weeks_table: str,
+            zone: str
+    ) -> ZoneSchedule | None:
+        """Return the zone's cached schedule, if any, even if it's expired."""
+        return self._schedules.get((client.base_url, weeks_table, zone))
+
+    async def async_get(
+            self,
+            client: BccApiClient,
+            weeks_table: str,
+            zone: str,
+            week_start: date
+    ) -> ZoneSchedule:
+        """Return the zone's schedule covering the week, fetching it if need be."""
+        key = (client.base_url, weeks_table, zone)
+
+        for _ in range(2):
+            schedule = self._schedules.get(key)
+            if (schedule is not None and not schedule.is_expired() and
+                    schedule.covers(week_start)):
+                self._schedules.move_to_end(key)
+                return schedule
+
+            # Join the fetch already under way for this zone, if any.  Fetches
+            # start from the current week, so that one covers every entry in
+            # the zone whichever week their next collection is in; only a
+            # week before that needs the second pass to fetch again.
+            if (in_flight := self._in_flight.get(key)) is None:
+                in_flight = asyncio.ensure_future(self._async_fetch(
+                    client, weeks_table, zone, min(week_start, _current_week_start())))
+                self._in_flight[key] = in_flight
+                in_flight.add_done_callback(lambda _: self._in_flight.pop(key, None))
+            schedule = await asyncio.shield(in_flight)
+
+        return schedule
+
+    async def _async_fetch(
+            self,
+            client: BccApiClient,
+            weeks_table: str,
+            zone: str,
+            week_start: date
+    ) -> ZoneSchedule:
+        """Fetch the zone's weeks from the given one on and cache them."""
+        query_date = f'{week_start:%Y-%m-%d}'.replace("'", "\\'")
+        query_zone = zone.replace("'", "\\'")
+        query = f"week_starting>=date'{query_date}' AND search(zone,'{query_zone}')"
+
+        results = await client.async_get_all_records(weeks_table, query)
+
+        schedule = ZoneSchedule.from_results(zone, week_start, results)
+        self._put((client.base_url, weeks_table, zone), schedule)
+        _LOGGER.debug(
+            "Fetched %d recycling weeks for zone %s", len(schedule.recycling_weeks), zone)
+        return schedule
+
+    def _put(self, key: ZoneKey, schedule: ZoneSchedule) -> None:
+        """Cache the schedule, evicting the least recently used beyond the limit."""
+        self._schedules[key] = schedule
+        self._schedules.move_to_end(key)
+        while len(self._schedules) > ZONE_SCHEDULES_MAX_ZONES:
+            self._schedules.popitem(last=False)
@@ -0,0 +1 @@
+"""Tests for the Brisbane Bin Day integration."""
@@ -0,0 +1 @@
+"""Benchmarks for the Brisbane Bin Day integration."""
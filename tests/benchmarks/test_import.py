@@ -0,0 +1,75 @@
+"""Benchmarks of the cost of importing the integration."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+# How many fresh interpreters the import is timed in.
+ROUNDS = 5
+
+# Imported first, as Home Assistant has them loaded before any integration.
+_HOME_ASSISTANT_MODULES = (
+    'homeassistant.components.calendar',
+    'homeassistant.components.sensor',
+    'homeassistant.config_entries',
+    'homeassistant.helpers.aiohttp_client',
+    'homeassistant.helpers.config_validation',
+    'homeassistant.helpers.storage',
+    'homeassistant.helpers.update_coordinator',
+)
+_INTEGRATION = 'custom_components.bin_day'
+# Dependencies that are too heavy to import when the integration loads.
+_HEAVY_MODULES = ('numpy', 'pandas')
+
+_MEASURE = f"""
+import importlib, json, pkgutil, sys, time, tracemalloc
+for name in {_HOME_ASSISTANT_MODULES!r}:
+    importlib.import_module(name)
+already = set(sys.modules)
+tracemalloc.start()
+started = time.perf_counter()
+# The package, then every module of it, as setup and the platforms load them.
+package = importlib.import_module({_INTEGRATION!r})
+for module in pkgutil.iter_modules(package.__path__, f'{{package.__name__}}.'):
+    importlib.import_module(module.name)
+seconds = time.perf_counter() - started
+_, peak = tracemalloc.get_traced_memory()
+print(json.dumps({{
+    'seconds': seconds,
+    'peak_bytes': peak,
+    'modules': sorted(set(sys.modules) - already),
+}}))
+"""
+
+pytestmark = pytest.mark.benchmark
+
+
+def _measure_import() -> dict:
+    """Import the integration in a fresh interpreter and return what it cost."""
+    result = subprocess.run(
+        [sys.executable, '-c', _MEASURE],
+        cwd=Path(__file__).parents[2], capture_output=True, check=True, text=True)
+    return json.loads(result.stdout)
+
+
+def test_cold_import(record_benchmark: Callable[..., None]) -> None:
+    """Time the import of the integration's modules, and its peak memory, after HA's own."""
+    measurements = [_measure_import() for _ in range(ROUNDS)]
+
+    modules = measurements[0]['modules']
+    assert not [name for name in modules if name.split('.')[0] in _HEAVY_MODULES]
+    record_benchmark(
+        'cold_import',
+        rounds=ROUNDS,
+        min_s=min(measurement['seconds'] for measurement in measurements),
+        max_s=max(measurement['seconds'] for measurement in measurements),
+        peak_bytes=max(measurement['peak_bytes'] for measurement in measurements),
+        modules_imported=len(modules),
+    )
@@ -0,0 +1,72 @@
+"""Benchmarks of the refreshes of many entries against a slow API."""
+
+from __future__ import annotations
+
+import asyncio
+
+from collections.abc import Callable
+from time import perf_counter
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.bin_day.coordinator import BccApiDataUpdateCoordinator
+
+from ..common import add_config_entries, timing_summary
+from ..fake_opendatasoft import FakeOpendatasoft
+
+# The round trip of each request to the fake API.
+LATENCY_SECONDS = 0.05
+
+pytestmark = pytest.mark.benchmark
+
+
+async def _async_timed_refreshes(
+        coordinators: list[BccApiDataUpdateCoordinator]) -> tuple[list[float], float]:
+    """Update the coordinators together; return each one's duration and the total."""
+
+    async def _async_timed(coordinator: BccApiDataUpdateCoordinator) -> float:
+        started = perf_counter()
+        # pylint: disable-next=protected-access
+        data = await coordinator._async_update_data()
+        duration = perf_counter() - started
+        # Without scheduling the next refresh, as async_set_updated_data would.
+        coordinator.data = data
+        return duration
+
+    started = perf_counter()
+    durations = await asyncio.gather(*(_async_timed(coordinator) for coordinator in coordinators))
+    return durations, perf_counter() - started
+
+
+@pytest.mark.parametrize('entries', [1, 10, 100, 1000])
+async def test_update_data_latency(
+        hass: HomeAssistant,
+        fake_api: FakeOpendatasoft,
+        record_benchmark: Callable[..., None],
+        entries: int
+) -> None:
+    """Time _async_update_data of every entry, cold and then with its data fetched."""
+    fake_api.properties = entries
+    fake_api.latency = LATENCY_SECONDS
+    coordinators = [
+        BccApiDataUpdateCoordinator(hass, entry) for entry in add_config_entries(hass, entries)]
+
+    cold, cold_total = await _async_timed_refreshes(coordinators)
+    cold_requests = len(fake_api.requests)
+    # What a refresh is left with to do once the days and weeks are known.
+    warm, warm_total = await _async_timed_refreshes(coordinators)
+
+    assert all(coordinator.data.recycling_week is not None for coordinator in coordinators)
+    record_benchmark(
+        'update_data_latency',
+        entries=entries,
+        latency_s=LATENCY_SECONDS,
+        cold=timing_summary(cold),
+        cold_wall_s=cold_total,
+        cold_requests=cold_requests,
+        warm=timing_summary(warm),
+        warm_wall_s=warm_total,
+        warm_requests=len(fake_api.requests) - cold_requests,
+    )
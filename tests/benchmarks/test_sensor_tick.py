@@ -0,0 +1,103 @@
+"""Benchmarks of the sensor updates the scheduler's ticks make."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from time import perf_counter
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.bin_day.coordinator import BccApiDataUpdateCoordinator
+from custom_components.bin_day.const import CONF_COMPACT_MODE, CONF_PROPERTY_NUMBER
+from custom_components.bin_day.sensor import (
+    SENSORS,
+    COMPACT_SENSOR,
+    BinDaySensorEntity,
+    BinDayCompactSensorEntity,
+)
+
+from ..common import add_config_entries, timing_summary
+from ..fake_opendatasoft import FakeOpendatasoft
+
+# How many times each tick is timed.
+ROUNDS = 5
+
+pytestmark = pytest.mark.benchmark
+
+
+def _ticking_sensors(
+        hass: HomeAssistant,
+        fake_api: FakeOpendatasoft,
+        entries: int,
+        compact_mode: bool
+) -> list[BinDaySensorEntity]:
+    """Return the sensors the ticks update, of entries whose data has been fetched."""
+    sensors = []
+    for entry in add_config_entries(hass, entries, **{CONF_COMPACT_MODE: compact_mode}):
+        coordinator = BccApiDataUpdateCoordinator(hass, entry)
+        data = coordinator._new_api_data()  # pylint: disable=protected-access
+        data.apply_days_record(fake_api.days_record(entry.options[CONF_PROPERTY_NUMBER]))
+        data.recycling_week = True
+        coordinator.data = data
+
+        if compact_mode:
+            descriptions = [COMPACT_SENSOR]
+            entity_class = BinDayCompactSensorEntity
+        else:
+            descriptions = [description for description in SENSORS if description.transitions]
+            entity_class = BinDaySensorEntity
+        for description in descriptions:
+            sensor = entity_class(
+                entry_id=entry.entry_id,
+                service_name=entry.title,
+                coordinator=coordinator,
+                entity_description=description,
+            )
+            sensor.hass = hass
+            # As if added to hass, so the ticks find nothing changed to write.
+            sensor._last_published = sensor._published_state()  # pylint: disable=protected-access
+            sensors.append(sensor)
+    return sensors
+
+
+def _time_tick(sensors: list[BinDaySensorEntity], cold: bool) -> float:
+    """Return how long one tick takes to update every sensor."""
+    if cold:
+        # As for the first tick of a new minute, which recomputes the snapshots.
+        for sensor in sensors:
+            sensor.coordinator.data._snapshot_key = None  # pylint: disable=protected-access
+    started = perf_counter()
+    for sensor in sensors:
+        sensor._update_callback()  # pylint: disable=protected-access
+    return perf_counter() - started
+
+
+@pytest.mark.parametrize('compact_mode', [False, True], ids=['sensors', 'compact'])
+@pytest.mark.parametrize('entries', [1, 10, 100, 1000])
+def test_sensor_tick_cost(
+        hass: HomeAssistant,
+        fake_api: FakeOpendatasoft,
+        record_benchmark: Callable[..., None],
+        entries: int,
+        compact_mode: bool
+) -> None:
+    """Time a tick that changes nothing, with the snapshots recomputed and memoized."""
+    sensors = _ticking_sensors(hass, fake_api, entries, compact_mode)
+
+    cold = [_time_tick(sensors, cold=True) for _ in range(ROUNDS)]
+    warm = [_time_tick(sensors, cold=False) for _ in range(ROUNDS)]
+
+    write_stats = [sensor.coordinator.write_stats for sensor in sensors]
+    assert not any(stats.emitted for stats in write_stats)
+    record_benchmark(
+        'sensor_tick_cost',
+        entries=entries,
+        compact_mode=compact_mode,
+        sensors=len(sensors),
+        cold=timing_summary(cold),
+        warm=timing_summary(warm),
+        cold_per_sensor_s=min(cold) / len(sensors),
+        warm_per_sensor_s=min(warm) / len(sensors),
+    )
@@ -0,0 +1,82 @@
+"""Micro-benchmarks of what each tick computes for one entry."""
+
+from __future__ import annotations
+
+import timeit
+
+from collections.abc import Callable
+
+import pytest
+
+from custom_components.bin_day.data import BccApiData
+from custom_components.bin_day.sensor import SENSORS
+
+from ..fake_opendatasoft import FakeOpendatasoft
+
+# Calls per timing, and the timings each result is the best of.
+NUMBER = 2000
+REPEAT = 5
+
+pytestmark = pytest.mark.benchmark
+
+
+def _api_data() -> BccApiData:
+    """Return the data of an entry whose days and recycling week are known."""
+    api_data = BccApiData(1, 12, 24, True)
+    api_data.apply_days_record(FakeOpendatasoft().days_record(1))
+    api_data.recycling_week = False
+    return api_data
+
+
+def _best_seconds(func: Callable[[], object]) -> float:
+    """Return the best time of one call of the function."""
+    return min(timeit.repeat(func, number=NUMBER, repeat=REPEAT)) / NUMBER
+
+
+def test_tick_values(record_benchmark: Callable[..., None]) -> None:
+    """Time the values a tick reads, each computed afresh and from a snapshot."""
+    api_data = _api_data()
+
+    def _one_by_one() -> tuple:
+        return (
+            api_data.next_collection_date(),
+            api_data.due_in_hours(),
+            api_data.is_bin_time(),
+            api_data.extra_bin_text(),
+            api_data.is_recycling_week(),
+            api_data.is_green_waste_week(),
+        )
+
+    def _snapshot_cold() -> tuple:
+        api_data._snapshot_key = None  # pylint: disable=protected-access
+        return tuple(api_data.snapshot())
+
+    def _snapshot_memoized() -> tuple:
+        return tuple(api_data.snapshot())
+
+    one_by_one = _best_seconds(_one_by_one)
+    snapshot_cold = _best_seconds(_snapshot_cold)
+    snapshot_memoized = _best_seconds(_snapshot_memoized)
+
+    assert snapshot_memoized < one_by_one
+    record_benchmark(
+        'tick_values',
+        one_by_one_s=one_by_one,
+        snapshot_cold_s=snapshot_cold,
+        snapshot_memoized_s=snapshot_memoized,
+        speedup=one_by_one / snapshot_memoized,
+    )
+
+
+def test_sensor_values(record_benchmark: Callable[..., None]) -> None:
+    """Time the native value of each sensor, with the snapshot memoized."""
+    api_data = _api_data()
+    api_data.snapshot()
+
+    record_benchmark(
+        'sensor_values',
+        value_s={
+            description.key: _best_seconds(lambda value=description.value: value(api_data))
+            for description in SENSORS if description.value is not None
+        },
+    )
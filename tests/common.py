@@ -0,0 +1,70 @@
+"""Helpers for the Brisbane Bin Day tests."""
+
+from __future__ import annotations
+
+import statistics
+
+from collections.abc import Sequence
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.bin_day.const import (
+    DOMAIN,
+    CONF_SERVICE_NAME,
+    CONF_BASE_URL,
+    CONF_DAYS_TABLE,
+    CONF_WEEKS_TABLE,
+    CONF_POLLING_INTERVAL_HOURS,
+    CONF_ALERT_HOURS,
+    CONF_PROPERTY_NUMBER,
+    CONF_HAS_GREEN_BIN,
+    DEFAULT_BASE_URL,
+    DEFAULT_DAYS_TABLE,
+    DEFAULT_WEEKS_TABLE,
+    DEFAULT_POLLING_INTERVAL_HOURS,
+    DEFAULT_ALERT_HOURS,
+)
+
+
+def mock_config_entry(property_number: int, **options: Any) -> MockConfigEntry:
+    """Return a config entry for the property, with the default options."""
+    return MockConfigEntry(
+        domain=DOMAIN,
+        title=f"Bin Day {property_number}",
+        data={},
+        options={
+            CONF_SERVICE_NAME: f"Bin Day {property_number}",
+            CONF_BASE_URL: DEFAULT_BASE_URL,
+            CONF_DAYS_TABLE: DEFAULT_DAYS_TABLE,
+            CONF_WEEKS_TABLE: DEFAULT_WEEKS_TABLE,
+            CONF_POLLING_INTERVAL_HOURS: DEFAULT_POLLING_INTERVAL_HOURS,
+            CONF_ALERT_HOURS: DEFAULT_ALERT_HOURS,
+            CONF_PROPERTY_NUMBER: property_number,
+            CONF_HAS_GREEN_BIN: True,
+            **options,
+        },
+    )
+
+
+def add_config_entries(hass: HomeAssistant, count: int, **options: Any) -> list[MockConfigEntry]:
+    """Add entries for properties 1 to 'count' to Home Assistant, without setting them up."""
+    entries = [mock_config_entry(property_number, **options)
+               for property_number in range(1, count + 1)]
+    for entry in entries:
+        entry.add_to_hass(hass)
+    return entries
+
+
+def timing_summary(seconds: Sequence[float]) -> dict[str, float]:
+    """Summarize timings, in seconds, for the benchmark results."""
+    ordered = sorted(seconds)
+    return {
+        'count': len(ordered),
+        'total_s': sum(ordered),
+        'mean_s': statistics.fmean(ordered),
+        'p50_s': ordered[(len(ordered) - 1) // 2],
+        'p95_s': ordered[round(0.95 * (len(ordered) - 1))],
+        'max_s': ordered[-1],
+    }
@@ -0,0 +1,70 @@
+"""Fixtures for the Brisbane Bin Day tests."""
+
+from __future__ import annotations
+
+import json
+
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from pytest_homeassistant_custom_component.test_util.aiohttp import AiohttpClientMocker
+
+from .fake_opendatasoft import FakeOpendatasoft
+
+_BENCHMARK_RESULTS = pytest.StashKey[list[dict[str, Any]]]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the option that runs the benchmarks."""
+    parser.addoption(
+        '--benchmark-json', metavar='PATH', default=None,
+        help="Run the benchmarks and write their results to PATH as JSON.")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Collect the benchmark results over the session."""
+    config.stash[_BENCHMARK_RESULTS] = []
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skip the benchmarks unless asked for."""
+    if config.getoption('--benchmark-json') is not None:
+        return
+    skip = pytest.mark.skip(reason="benchmarks only run with --benchmark-json")
+    for item in items:
+        if 'benchmark' in item.keywords:
+            item.add_marker(skip)
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """Write the benchmark results, if the benchmarks were run."""
+    if (path := session.config.getoption('--benchmark-json')) is not None:
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(session.config.stash[_BENCHMARK_RESULTS], file, indent=2)
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations: None) -> None:
+    """Load the integration from custom_components."""
+
+
+@pytest.fixture
+def record_benchmark(request: pytest.FixtureRequest) -> Callable[..., None]:
+    """Return a function that records a benchmark result for the JSON output."""
+    results = request.config.stash[_BENCHMARK_RESULTS]
+
+    def _record(name: str, **values: Any) -> None:
+        results.append({'benchmark': name, 'test': request.node.nodeid, **values})
+
+    return _record
+
+
+@pytest.fixture
+def fake_api(aioclient_mock: AiohttpClientMocker) -> FakeOpendatasoft:
+    """Serve the BCC API from a fake, which tests can make slow or failing."""
+    fake = FakeOpendatasoft()
+    fake.register(aioclient_mock)
+    return fake
+
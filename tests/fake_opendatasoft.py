@@ -0,0 +1,146 @@
+"""A local fake of the Opendatasoft records endpoint the BCC API is served by."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import re
+
+from datetime import date, timedelta
+from http import HTTPStatus
+from typing import Any
+from urllib.parse import parse_qs
+
+from pytest_homeassistant_custom_component.test_util.aiohttp import (
+    AiohttpClientMocker,
+    AiohttpClientMockResponse,
+)
+from yarl import URL
+
+from custom_components.bin_day.const import DEFAULT_DAYS_TABLE, DEFAULT_WEEKS_TABLE
+from custom_components.bin_day.data import DaysRecord
+
+RECORDS_URL = re.compile(r'/api/explore/v2\.1/catalog/datasets/([^/]+)/records')
+
+_PROPERTY_IN = re.compile(r'property_id in \(([\d, ]*)\)')
+_ZONE_WEEKS = re.compile(r"week_starting>=date'(\d{4}-\d{2}-\d{2})' AND search\(zone,'(.*)'\)")
+
+DAYS = ('MONDAY', 'TUESDAY', 'WEDNESDAY', 'THURSDAY', 'FRIDAY')
+SUBURBS = ('ASHGROVE', 'BARDON', 'CHERMSIDE', 'KEDRON', 'RED HILL', 'WILSTON')
+STREETS = ('SMITH ST', 'JONES RD', 'ROSE AVE', 'HILL TCE', 'PARK PDE')
+# How many weeks of a zone's schedule the weeks dataset has from any date.
+SCHEDULE_WEEKS = 52
+
+
+class FakeOpendatasoft:
+    """Answers records queries for the days and weeks datasets from generated data.
+
+    Property numbers 1 to 'properties' exist, spread over 'zones' zones
+    whose recycling weeks alternate, in the datasets named 'days_table'
+    and 'weeks_table'.  Each request waits 'latency' seconds,
+    fails with probability 'error_rate' in the way 'error' says ('api',
+    'http' or 'timeout'), and pads each record with 'padding_bytes' bytes.
+    """
+
+    def __init__(
+            self,
+            *,
+            properties: int = 100,
+            zones: int = 4,
+            latency: float = 0.0,
+            error_rate: float = 0.0,
+            error: str = 'api',
+            padding_bytes: int = 0,
+            days_table: str = DEFAULT_DAYS_TABLE,
+            weeks_table: str = DEFAULT_WEEKS_TABLE,
+            seed: int = 0
+    ) -> None:
+        """Initialize the fake's data and behavior."""
+        self.properties = properties
+        self.zones = zones
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error = error
+        self.padding_bytes = padding_bytes
+        self.days_table = days_table
+        self.weeks_table = weeks_table
+        self.requests: list[URL] = []
+        self._random = random.Random(seed)
+
+    def register(self, aioclient_mock: AiohttpClientMocker) -> None:
+        """Answer every records request made through the mocked session."""
+        aioclient_mock.get(RECORDS_URL, side_effect=self._async_handle)
+
+    @staticmethod
+    def zone(property_number: int, zones: int) -> str:
+        """Return the zone of a property."""
+        return f'ZONE {property_number % zones + 1}'
+
+    def days_result(self, property_number: int) -> dict[str, Any]:
+        """Return the days dataset's record of a property."""
+        return {
+            'property_id': property_number,
+            'suburb': SUBURBS[property_number % len(SUBURBS)],
+            'street_name': STREETS[property_number % len(STREETS)],
+            'house_number': str(property_number % 200 + 1),
+            'collection_day': DAYS[property_number % len(DAYS)],
+            'zone': self.zone(property_number, self.zones),
+        }
+
+    def days_record(self, property_number: int) -> DaysRecord:
+        """Return the days record of a property, as a refresh would make it."""
+        return DaysRecord.from_result(self.days_result(property_number))
+
+    def recycling_weeks(self, zone: str, starting: date) -> list[date]:
+        """Return the weeks the zone's recycling is collected, from the given date on."""
+        parity = int(zone.rsplit(' ', 1)[-1]) % 2
+        monday = starting - timedelta(days=starting.weekday())
+        weeks = (monday + timedelta(weeks=week) for week in range(SCHEDULE_WEEKS))
+        return [
+            week for week in weeks
+            if week >= starting and (week.toordinal() // 7) % 2 == parity
+        ]
+
+    def _results(self, dataset: str, where: str) -> list[dict[str, Any]]:
+        """Return every record matching the query."""
+        if dataset == self.days_table and (match := _PROPERTY_IN.fullmatch(where)):
+            numbers = (int(number) for number in match[1].split(',') if number.strip())
+            return [
+                self.days_result(number) for number in numbers
+                if 1 <= number <= self.properties
+            ]
+        if dataset == self.weeks_table and (match := _ZONE_WEEKS.fullmatch(where)):
+            zone = match[2].replace("\\'", "'")
+            return [
+                {'week_starting': week.isoformat(), 'zone': zone}
+                for week in self.recycling_weeks(zone, date.fromisoformat(match[1]))
+            ]
+        raise AssertionError(f"Unexpected query of {dataset}: {where}")
+
+    async def _async_handle(self, method: str, url: URL, data: Any) -> AiohttpClientMockResponse:
+        """Answer one records request."""
+        self.requests.append(url)
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        if self.error_rate and self._random.random() < self.error_rate:
+            if self.error == 'timeout':
+                return AiohttpClientMockResponse(method, url, exc=TimeoutError())
+            if self.error == 'http':
+                return AiohttpClientMockResponse(
+                    method, url, status=HTTPStatus.BAD_GATEWAY, text='<html>Bad Gateway</html>')
+            return AiohttpClientMockResponse(
+                method, url, status=HTTPStatus.BAD_REQUEST,
+                json={'error_code': 'ODSQLError', 'message': 'Injected error'})
+
+        query = parse_qs(url.query_string)
+        dataset = RECORDS_URL.search(url.path)[1]
+        results = self._results(dataset, query['where'][0])
+        offset = int(query.get('offset', ['0'])[0])
+        limit = int(query.get('limit', ['10'])[0])
+        page = results[offset:offset + limit]
+        if self.padding_bytes:
+            page = [{**result, 'padding': 'x' * self.padding_bytes} for result in page]
+
+        return AiohttpClientMockResponse(
+            method, url, json={'total_count': len(results), 'results': page})
@@ -0,0 +1,46 @@
+"""Tests of the config and options flows."""
+
+from __future__ import annotations
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+
+from custom_components.bin_day.const import CONF_EXPORT_URL, CONF_SERVICE_NAME
+
+from .common import mock_config_entry
+
+CUSTOM_EXPORT_URL = 'https://example.com/{dataset}.json'
+
+
+@pytest.mark.parametrize('advanced', [False, True])
+async def test_options_export_url_is_advanced(hass: HomeAssistant, advanced: bool) -> None:
+    """Test the export URL is only shown in advanced mode."""
+    entry = mock_config_entry(1)
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(
+        entry.entry_id, context={'show_advanced_options': advanced})
+
+    assert result['type'] is FlowResultType.FORM
+    assert (CONF_EXPORT_URL in result['data_schema'].schema) is advanced
+
+
+async def test_options_keep_hidden_export_url(hass: HomeAssistant) -> None:
+    """Test saving the options outside advanced mode keeps the export URL set before."""
+    entry = mock_config_entry(1, **{CONF_EXPORT_URL: CUSTOM_EXPORT_URL})
+    entry.add_to_hass(hass)
+    result = await hass.config_entries.options.async_init(
+        entry.entry_id, context={'show_advanced_options': False})
+    user_input = {
+        key: value for key, value in entry.options.items()
+        if key in result['data_schema'].schema
+    }
+
+    result = await hass.config_entries.options.async_configure(
+        result['flow_id'], {**user_input, CONF_SERVICE_NAME: 'Renamed'})
+
+    assert result['type'] is FlowResultType.CREATE_ENTRY
+    assert entry.options[CONF_SERVICE_NAME] == 'Renamed'
+    assert entry.options[CONF_EXPORT_URL] == CUSTOM_EXPORT_URL
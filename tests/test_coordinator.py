@@ -0,0 +1,124 @@
+"""Tests of the refreshes of the coordinator against the fake BCC API."""
+
+from __future__ import annotations
+
+import asyncio
+
+from datetime import date, timedelta
+
+import pytest
+
+from freezegun import freeze_time
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant
+
+from custom_components.bin_day.coordinator import BccApiDataUpdateCoordinator
+from custom_components.bin_day.const import DEFAULT_DAYS_TABLE
+
+from .common import add_config_entries
+from .fake_opendatasoft import FakeOpendatasoft
+
+
+async def test_refresh(hass: HomeAssistant, fake_api: FakeOpendatasoft) -> None:
+    """Test a refresh fills in the property's data and recycling week."""
+    entry, = add_config_entries(hass, 1)
+    coordinator = BccApiDataUpdateCoordinator(hass, entry)
+
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    expected = fake_api.days_result(1)
+    data = coordinator.data
+    assert data.suburb == expected['suburb']
+    assert data.collection_day == expected['collection_day']
+    assert data.collection_zone == expected['zone']
+    assert data.recycling_week is not None
+    assert coordinator.metrics.fetch_failures() == 0
+
+
+# Each day of a week, as entries in a zone can have their next collections in different weeks.
+@pytest.mark.parametrize('today', [f'2026-10-{day}' for day in range(12, 19)])
+async def test_refreshes_batch_days_records(
+        hass: HomeAssistant,
+        fake_api: FakeOpendatasoft,
+        today: str
+) -> None:
+    """Test entries refreshing together share the days requests and zone schedules."""
+    entries = add_config_entries(hass, 10)
+    coordinators = [BccApiDataUpdateCoordinator(hass, entry) for entry in entries]
+
+    # Ticking, so that the rate limiter's tokens still refill.
+    with freeze_time(f'{today} 10:00:00', tick=True):
+        await asyncio.gather(*(coordinator.async_refresh() for coordinator in coordinators))
+
+    assert all(coordinator.data.recycling_week is not None for coordinator in coordinators)
+    days_requests = [url for url in fake_api.requests if DEFAULT_DAYS_TABLE in url.path]
+    assert len(days_requests) == 1
+    assert len(fake_api.requests) == 1 + fake_api.zones
+
+
+async def test_refresh_failure(hass: HomeAssistant, fake_api: FakeOpendatasoft) -> None:
+    """Test a failing API leaves the data unknown and counts the failures."""
+    fake_api.error_rate = 1.0
+    fake_api.error = 'http'
+    entry, = add_config_entries(hass, 1)
+    coordinator = BccApiDataUpdateCoordinator(hass, entry)
+
+    await coordinator.async_refresh()
+
+    assert coordinator.data.collection_day is None
+    assert coordinator.data.recycling_week is None
+    assert coordinator.metrics.fetch_failures() > 0
+
+
+async def test_refresh_failure_keeps_data(
+        hass: HomeAssistant,
+        fake_api: FakeOpendatasoft,
+        freezer: FrozenDateTimeFactory
+) -> None:
+    """Test a refresh that fails keeps the data of the last good one."""
+    # A Monday, with property 1 collected on Tuesday.
+    freezer.move_to('2026-10-12 08:00:00')
+    entry, = add_config_entries(hass, 1)
+    coordinator = BccApiDataUpdateCoordinator(hass, entry)
+    await coordinator.async_refresh()
+    good = coordinator.data
+
+    # Past the batch cache, and with the days record due to be refetched.
+    fake_api.error_rate = 1.0
+    freezer.tick(timedelta(hours=4))
+    coordinator._days_fetched_at = None  # pylint: disable=protected-access
+    await coordinator.async_refresh()
+
+    data = coordinator.data
+    assert data is not good
+    assert data.days_record() == good.days_record()
+    assert data.collection_day == 'TUESDAY'
+    assert data.recycling_week is good.recycling_week is not None
+    assert coordinator.metrics.fetch_failures() > 0
+
+
+async def test_refresh_failure_uses_expired_schedule(
+        hass: HomeAssistant,
+        fake_api: FakeOpendatasoft,
+        freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the recycling week comes from the expired zone schedule while it can't be refetched."""
+    freezer.move_to('2026-10-12 08:00:00')
+    entry, = add_config_entries(hass, 1)
+    coordinator = BccApiDataUpdateCoordinator(hass, entry)
+    await coordinator.async_refresh()
+    first_week = coordinator.data.recycling_week
+
+    # Five weeks on, with the schedule expired and the next collection in another week.
+    fake_api.error_rate = 1.0
+    freezer.tick(timedelta(weeks=5))
+    await coordinator.async_refresh()
+
+    zone = fake_api.zone(1, fake_api.zones)
+    data = coordinator.data
+    assert data.collection_week_start() == date(2026, 11, 16)
+    assert data.recycling_week == (
+        date(2026, 11, 16) in fake_api.recycling_weeks(zone, date(2026, 10, 12)))
+    assert data.recycling_week is not first_week
+    assert coordinator.metrics.fetch_failures() > 0
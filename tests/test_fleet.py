@@ -0,0 +1,64 @@
+"""Tests of the due times computed for many properties at once."""
+
+from __future__ import annotations
+
+import calendar
+
+from datetime import datetime
+
+import pytest
+
+from hypothesis import given, strategies as st
+
+from custom_components.bin_day.data import BccApiData, DaysRecord
+from custom_components.bin_day.fleet import FleetSchedule
+
+# The vectorized engine is what's under test; without NumPy there's nothing to compare.
+pytest.importorskip('numpy')
+
+DAYS = [name.upper() for name in calendar.day_name]
+
+_datetimes = st.datetimes(min_value=datetime(2000, 1, 1), max_value=datetime(2100, 1, 1))
+# The times a due hour ticks over, a microsecond before them, and any in between.
+nows = st.one_of(
+    _datetimes.map(lambda now: now.replace(minute=0, second=0, microsecond=0)),
+    _datetimes.map(lambda now: now.replace(minute=59, second=59, microsecond=999999)),
+    _datetimes,
+)
+
+properties = st.lists(
+    st.tuples(
+        # None for a property whose days data hasn't been fetched.
+        st.one_of(st.none(), st.sampled_from(DAYS)),
+        st.integers(min_value=0, max_value=24 * 8),
+    ),
+    max_size=50,
+)
+
+
+def _api_data(property_number: int, collection_day: str | None, alert_hours: int) -> BccApiData:
+    """Return the data of a property with the given collection day, if known."""
+    api_data = BccApiData(property_number, alert_hours, 24, True)
+    if collection_day is not None:
+        api_data.apply_days_record(DaysRecord(
+            suburb='ASHGROVE',
+            street_name='SMITH ST',
+            house_number='1',
+            collection_day=collection_day,
+            collection_zone='ZONE 1',
+        ))
+    return api_data
+
+
+@given(properties=properties, times=st.lists(nows, min_size=1, max_size=3))
+def test_due_times_match_one_by_one(
+        properties: list[tuple[str | None, int]], times: list[datetime]) -> None:
+    """Test the vectorized due times are those of each property's own methods."""
+    fleet = FleetSchedule(
+        _api_data(property_number, collection_day, alert_hours)
+        for property_number, (collection_day, alert_hours) in enumerate(properties))
+
+    # More than one time, for the columns that are kept between calls.
+    for now in times:
+        # pylint: disable-next=protected-access
+        assert fleet.due_times(now) == fleet._due_times_one_by_one(now)
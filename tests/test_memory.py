@@ -0,0 +1,97 @@
+"""Tests of the memory the data of many entries takes."""
+
+from __future__ import annotations
+
+import gc
+import json
+import tracemalloc
+
+from datetime import date
+
+from custom_components.bin_day.api import BccApiClient
+from custom_components.bin_day.const import DEFAULT_BASE_URL, DEFAULT_WEEKS_TABLE
+from custom_components.bin_day.data import BccApiData, DaysRecord
+from custom_components.bin_day.schedule import ZoneSchedule
+from custom_components.bin_day.zones import ZoneScheduleCache
+
+from .fake_opendatasoft import FakeOpendatasoft
+
+ENTRIES = 1000
+# The most each entry's data may take, once the strings and schedules are shared.
+BYTES_PER_ENTRY = 400
+
+
+def _stored_snapshots(fake_api: FakeOpendatasoft) -> str:
+    """Return what each entry would have saved, as the JSON its store is loaded from."""
+    starts = date(2026, 10, 12)
+    # Entries in the same zone save the zone's one schedule.
+    zone_schedules = {
+        zone: ZoneSchedule.from_results(
+            zone, starts,
+            [{'week_starting': week.isoformat()} for week in fake_api.recycling_weeks(zone, starts)],
+        ).as_dict()
+        for zone in {fake_api.zone(number, fake_api.zones) for number in range(1, ENTRIES + 1)}
+    }
+    return json.dumps([
+        {
+            'days_record': fake_api.days_result(property_number),
+            'zone_schedule': zone_schedules[fake_api.zone(property_number, fake_api.zones)],
+        }
+        for property_number in range(1, ENTRIES + 1)
+    ])
+
+
+def _restore(
+        stored: dict,
+        client: BccApiClient,
+        zone_schedules: ZoneScheduleCache
+) -> tuple[BccApiData, ZoneSchedule]:
+    """Restore an entry's data and schedule, as the coordinator does."""
+    result = stored['days_record']
+    api_data = BccApiData(result['property_id'], 12, 24, True)
+    api_data.apply_days_record(DaysRecord.interned(
+        suburb=result['suburb'],
+        street_name=result['street_name'],
+        house_number=result['house_number'],
+        collection_day=result['collection_day'],
+        collection_zone=result['zone'],
+    ))
+    schedule = zone_schedules.async_seed(
+        client, DEFAULT_WEEKS_TABLE, ZoneSchedule.from_dict(stored['zone_schedule']))
+    api_data.recycling_week = schedule.is_recycling_week(api_data.collection_week_start())
+    return api_data, schedule
+
+
+def test_memory_per_entry() -> None:
+    """Test the restored data of many entries stays within the per-entry budget."""
+    fake_api = FakeOpendatasoft(properties=ENTRIES)
+    stored_snapshots = _stored_snapshots(fake_api)
+    client = BccApiClient(None, DEFAULT_BASE_URL)
+    zone_schedules = ZoneScheduleCache()
+    # Whatever the first restore imports and caches isn't the entries' data.
+    _restore(json.loads(stored_snapshots)[0], client, ZoneScheduleCache())
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        # Decoded inside the measurement, so that no string is shared with the fake's.
+        entries = [
+            _restore(stored, client, zone_schedules)
+            for stored in json.loads(stored_snapshots)
+        ]
+        gc.collect()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    retained = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    assert retained / ENTRIES <= BYTES_PER_ENTRY
+
+    # Entries on the same street, in the same zone, share the one copy.
+    first, _ = entries[0]
+    same_street, _ = entries[60]
+    assert same_street.street_name == first.street_name
+    assert same_street.street_name is first.street_name
+    assert same_street.collection_zone is first.collection_zone
+    assert len({id(schedule) for _, schedule in entries}) == fake_api.zones
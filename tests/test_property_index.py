@@ -0,0 +1,50 @@
+"""Tests of the local index of the days dataset."""
+
+from __future__ import annotations
+
+from time import time
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.bin_day.api import BccApiClient, BccApiError
+from custom_components.bin_day.const import (
+    DEFAULT_DAYS_TABLE,
+    DEFAULT_EXPORT_URL,
+    PROPERTY_INDEX_REFRESH_SECONDS,
+)
+from custom_components.bin_day.property_index import get_property_index
+
+
+async def test_index_per_export_url(hass: HomeAssistant) -> None:
+    """Test the same dataset exported from different URLs is indexed in different files."""
+    index = get_property_index(hass, DEFAULT_EXPORT_URL, DEFAULT_DAYS_TABLE)
+    other = get_property_index(hass, 'https://example.com/{dataset}.json', DEFAULT_DAYS_TABLE)
+
+    assert index is not other
+    assert index._path != other._path  # pylint: disable=protected-access
+
+
+async def test_rebuild_failure_backs_off(
+        hass: HomeAssistant, caplog: pytest.LogCaptureFixture) -> None:
+    """Test a failed rebuild is logged, and not retried on every lookup."""
+    index = get_property_index(hass, DEFAULT_EXPORT_URL, DEFAULT_DAYS_TABLE)
+    # pylint: disable-next=protected-access
+    index._built_at = time() - PROPERTY_INDEX_REFRESH_SECONDS - 1
+    client = BccApiClient(None, DEFAULT_EXPORT_URL)
+    builds = 0
+
+    async def _async_build(_client: BccApiClient) -> None:
+        nonlocal builds
+        builds += 1
+        raise BccApiError("Export unavailable")
+
+    with patch.object(index, '_async_build', _async_build):
+        for _ in range(3):
+            await index.async_ensure_built(client)
+            await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert builds == 1
+    assert "Error rebuilding" in caplog.text
@@ -0,0 +1,96 @@
+"""Tests of the actions of the integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+from custom_components.bin_day.const import (
+    DOMAIN,
+    CONF_DAYS_TABLE,
+    CONF_WEEKS_TABLE,
+    DEFAULT_DAYS_TABLE,
+    DEFAULT_WEEKS_TABLE,
+    SERVICE_GET_SCHEDULE,
+    SERVICE_GET_DUE_TIMES,
+)
+from custom_components.bin_day.coordinator import BccApiDataUpdateCoordinator
+from custom_components.bin_day.services import async_setup_services
+
+from .common import add_config_entries, mock_config_entry
+from .fake_opendatasoft import FakeOpendatasoft
+
+OTHER_TABLES = {CONF_DAYS_TABLE: 'other-days', CONF_WEEKS_TABLE: 'other-weeks'}
+
+
+async def _async_get_schedule(hass: HomeAssistant, **data: Any) -> dict[str, Any]:
+    """Call the get_schedule action and return its response."""
+    return await hass.services.async_call(
+        DOMAIN, SERVICE_GET_SCHEDULE, {'property_numbers': [1, 2], **data},
+        blocking=True, return_response=True)
+
+
+@pytest.mark.parametrize(
+    ('entry_options', 'tables'),
+    [
+        (None, (DEFAULT_DAYS_TABLE, DEFAULT_WEEKS_TABLE)),
+        ({}, (DEFAULT_DAYS_TABLE, DEFAULT_WEEKS_TABLE)),
+        (OTHER_TABLES, ('other-days', 'other-weeks')),
+    ],
+    ids=['unconfigured', 'default_tables', 'other_tables'],
+)
+async def test_get_schedule_tables(
+        hass: HomeAssistant,
+        fake_api: FakeOpendatasoft,
+        entry_options: dict[str, str] | None,
+        tables: tuple[str, str]
+) -> None:
+    """Test properties are looked up in the tables of the configured entries, if any."""
+    fake_api.days_table, fake_api.weeks_table = tables
+    if entry_options is not None:
+        mock_config_entry(1, **entry_options).add_to_hass(hass)
+    async_setup_services(hass)
+
+    response = await _async_get_schedule(hass)
+
+    assert response['1']['found'] and response['2']['found']
+    assert response['1']['collections']
+    assert {url.path.split('/')[-2] for url in fake_api.requests} == set(tables)
+
+
+async def test_get_schedule_config_entry(
+        hass: HomeAssistant, fake_api: FakeOpendatasoft) -> None:
+    """Test properties are looked up in the tables of the given config entry."""
+    fake_api.days_table, fake_api.weeks_table = 'other-days', 'other-weeks'
+    mock_config_entry(1).add_to_hass(hass)
+    entry = mock_config_entry(2, **OTHER_TABLES)
+    entry.add_to_hass(hass)
+    async_setup_services(hass)
+
+    response = await _async_get_schedule(hass, config_entry_id=entry.entry_id)
+
+    assert response['1']['found']
+
+    with pytest.raises(HomeAssistantError):
+        await _async_get_schedule(hass, config_entry_id='missing')
+
+
+async def test_get_due_times(hass: HomeAssistant, fake_api: FakeOpendatasoft) -> None:
+    """Test the due times of every configured property are returned."""
+    coordinators = {}
+    for entry in add_config_entries(hass, 3):
+        coordinator = coordinators[entry.entry_id] = BccApiDataUpdateCoordinator(hass, entry)
+        await coordinator.async_refresh()
+    hass.data[DOMAIN] = coordinators
+    async_setup_services(hass)
+
+    response = await hass.services.async_call(
+        DOMAIN, SERVICE_GET_DUE_TIMES, {}, blocking=True, return_response=True)
+
+    assert set(response) == {'1', '2', '3'}
+    due_in_hours = coordinators[next(iter(coordinators))].data.due_in_hours()
+    assert response['1']['due_in_hours'] == due_in_hours
@@ -0,0 +1,46 @@
+"""Tests of the storage of the last good data."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.bin_day.const import DOMAIN
+from custom_components.bin_day.store import create_store
+
+from .fake_opendatasoft import FakeOpendatasoft
+
+
+async def test_migrate_from_1_2(hass: HomeAssistant, hass_storage: dict[str, Any]) -> None:
+    """Test the recycling flag of the 1.2 format is dropped."""
+    days_result = FakeOpendatasoft().days_result(1)
+    hass_storage[f'{DOMAIN}.entry'] = {
+        'version': 1,
+        'minor_version': 2,
+        'key': f'{DOMAIN}.entry',
+        'data': {
+            'property_number': 1,
+            'days_record': {
+                'suburb': days_result['suburb'],
+                'street_name': days_result['street_name'],
+                'house_number': days_result['house_number'],
+                'collection_day': days_result['collection_day'],
+                'collection_zone': days_result['zone'],
+            },
+            'recycling_week': True,
+            'zone_schedule': {
+                'zone': days_result['zone'],
+                'starts': '2026-10-12',
+                'recycling_weeks': ['2026-10-12', '2026-10-26'],
+                'fetched_at': 0.0,
+            },
+        },
+    }
+    store = create_store(hass, 'entry')
+
+    days_record, zone_schedule = await store.async_load_snapshot(1)
+
+    assert days_record.suburb == days_result['suburb']
+    assert zone_schedule.recycling_weeks[-1].isoformat() == '2026-10-26'
+    assert 'recycling_week' not in await store.async_load()